@@ -43,6 +43,31 @@ def main():
         action="store_true",
         help="Enable voice feedback"
     )
+    parser.add_argument(
+        "--no-mirror",
+        action="store_true",
+        help="Show the camera feed unmirrored (skips a full-frame flip)"
+    )
+    parser.add_argument(
+        "--infer-width",
+        type=int,
+        default=640,
+        help="Width frames are downscaled to for pose detection (0 = full resolution)"
+    )
+    parser.add_argument(
+        "--model-complexity",
+        type=int,
+        choices=[0, 1, 2],
+        default=1,
+        help="Pose model size: 0 = lite (fastest), 1 = full, 2 = heavy (most accurate)"
+    )
+    parser.add_argument(
+        "--overlay",
+        type=str,
+        choices=["skeleton", "required", "none"],
+        default="skeleton",
+        help="Landmark overlay: full skeleton, only the current exercise's landmarks, or none"
+    )
     
     args = parser.parse_args()
     
@@ -51,7 +76,11 @@ def main():
         from src.app import FitnessCoachApp
         app = FitnessCoachApp(
             starting_exercise=args.exercise,
-            voice_enabled=args.voice
+            voice_enabled=args.voice,
+            mirror=not args.no_mirror,
+            infer_width=args.infer_width,
+            model_complexity=args.model_complexity,
+            overlay=args.overlay
         )
         app.run()
     elif args.mode == "streamlit":
@@ -15,6 +15,9 @@ Features:
 import cv2
 import numpy as np
 from typing import Optional, Dict, Tuple
+import functools
+import queue
+import threading
 import time
 
 # Import pose detector
@@ -29,7 +32,7 @@ from .exercises.lateral_raise import LateralRaiseTracker
 from .exercises.front_raise import FrontRaiseTracker
 from .exercises.shoulder_shrug import ShoulderShrugTracker
 from .exercises.tricep_extension import TricepExtensionTracker
-from .exercises.base import ExerciseResult
+from .exercises.base import BaseExerciseTracker, ExerciseResult
 
 # Try to import voice feedback
 try:
@@ -45,28 +48,80 @@ class VoiceFeedback:
     Voice feedback system using pyttsx3.
     
     Provides audio feedback for rep counts and form corrections.
+    Speech is synthesized on a background thread so it never blocks
+    the video loop.
     """
     
+    # Maximum pending messages; the oldest is dropped when full
+    QUEUE_SIZE = 4
+    
+    # Seconds to wait for the worker thread to create the engine
+    INIT_TIMEOUT = 5.0
+    
     def __init__(self):
         """Initialize the voice engine."""
         self.engine = None
         self.enabled = False
-        self.last_feedback_time = 0
+        self.last_feedback_time = float('-inf')  # time.monotonic() of last message
         self.feedback_cooldown = 2.0  # Seconds between voice feedback
+        self._tts_q: queue.Queue = queue.Queue(maxsize=self.QUEUE_SIZE)
         
         if VOICE_AVAILABLE:
+            # The sapi5 (COM) and nsss drivers must be used from the thread
+            # that created the engine, so the worker creates it
+            ready = threading.Event()
+            threading.Thread(target=self._tts_loop, args=(ready,), daemon=True).start()
+            ready.wait(self.INIT_TIMEOUT)
+            self.enabled = self.engine is not None
+    
+    def _tts_loop(self, ready: threading.Event):
+        """
+        Create the engine, then speak queued messages one at a time.
+        
+        Runs on the worker thread.
+        
+        Args:
+            ready: Set once the engine is created (or creation failed)
+        """
+        try:
+            engine = pyttsx3.init()
+            engine.setProperty('rate', 150)  # Speed of speech
+            engine.setProperty('volume', 0.9)
+            self.engine = engine
+        except Exception as e:
+            print(f"Could not initialize voice engine: {e}")
+            return
+        finally:
+            ready.set()
+        
+        while True:
+            text = self._tts_q.get()
             try:
-                self.engine = pyttsx3.init()
-                self.engine.setProperty('rate', 150)  # Speed of speech
-                self.engine.setProperty('volume', 0.9)
-                self.enabled = True
+                self.engine.say(text)
+                self.engine.runAndWait()
             except Exception as e:
-                print(f"Could not initialize voice engine: {e}")
-                self.enabled = False
+                print(f"Voice error: {e}")
+    
+    def _enqueue(self, text: str):
+        """
+        Queue text for the worker thread, dropping the stalest message if full.
+        
+        Args:
+            text: Text to speak
+        """
+        while True:
+            try:
+                self._tts_q.put_nowait(text)
+                return
+            except queue.Full:
+                try:
+                    self._tts_q.get_nowait()
+                except queue.Empty:
+                    pass
     
     def speak(self, text: str, force: bool = False):
         """
-        Speak the given text.
+        Speak the given text (non-blocking).
         
         Args:
             text: Text to speak
@@ -75,20 +130,16 @@ class VoiceFeedback:
         if not self.enabled or not self.engine:
             return
             
-        current_time = time.time()
+        current_time = time.monotonic()
         if not force and (current_time - self.last_feedback_time) < self.feedback_cooldown:
             return
             
-        try:
-            self.engine.say(text)
-            self.engine.runAndWait()
-            self.last_feedback_time = current_time
-        except Exception as e:
-            print(f"Voice error: {e}")
+        self._enqueue(text)
+        self.last_feedback_time = current_time
     
     def speak_async(self, text: str):
         """
-        Queue text for speaking (non-blocking).
+        Queue text for speaking without applying the cooldown.
         
         Args:
             text: Text to speak
@@ -96,11 +147,7 @@ class VoiceFeedback:
         if not self.enabled or not self.engine:
             return
             
-        try:
-            self.engine.say(text)
-            # Don't wait - let it play in background
-        except Exception:
-            pass
+        self._enqueue(text)
     
     def toggle(self):
         """Toggle voice feedback on/off."""
@@ -127,48 +174,51 @@ class UIRenderer:
         'purple': (255, 0, 128)
     }
     
+    # Form score color lookup indexed by int(score): red < 40 <= yellow < 70 <= green
+    SCORE_COLOR_LUT = (
+        [COLORS['red']] * 40 + [COLORS['yellow']] * 30 + [COLORS['green']] * 31
+    )
+    
+    def __init__(self):
+        """Initialize the per-renderer panel caches."""
+        # Info panel layer for the last drawn panel state: (key, layer)
+        self._info_panel_cache: Tuple[Optional[Tuple], Optional['OverlayLayer']] = (None, None)
+        
+        # Controls help layers, keyed by frame size
+        self._help_cache: Dict[Tuple[int, int], 'OverlayLayer'] = {}
+    
     @staticmethod
-    def draw_rounded_rect(
-        img: np.ndarray,
-        pt1: Tuple[int, int],
-        pt2: Tuple[int, int],
-        color: Tuple[int, int, int],
-        thickness: int = -1,
-        radius: int = 10,
-        alpha: float = 0.7
-    ):
+    def score_color(form_score: float) -> Tuple[int, int, int]:
         """
-        Draw a rounded rectangle with transparency.
+        Get the display color for a form score.
         
         Args:
-            img: Image to draw on
-            pt1: Top-left corner
-            pt2: Bottom-right corner
-            color: BGR color
-            thickness: -1 for filled
-            radius: Corner radius
-            alpha: Transparency (0-1)
+            form_score: Form score (0-100)
+            
+        Returns:
+            BGR color
         """
-        overlay = img.copy()
-        
-        x1, y1 = pt1
-        x2, y2 = pt2
+        return UIRenderer.SCORE_COLOR_LUT[max(0, min(100, int(form_score)))]
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def classify_feedback(feedback: str) -> Tuple[bool, bool]:
+        """
+        Classify a feedback message by its markers.
         
-        # Draw rounded rectangle on overlay
-        cv2.rectangle(overlay, (x1 + radius, y1), (x2 - radius, y2), color, thickness)
-        cv2.rectangle(overlay, (x1, y1 + radius), (x2, y2 - radius), color, thickness)
+        Trackers reuse a small set of messages, so results are memoized
+        instead of re-scanning the string every frame.
         
-        # Draw corners
-        cv2.ellipse(overlay, (x1 + radius, y1 + radius), (radius, radius), 180, 0, 90, color, thickness)
-        cv2.ellipse(overlay, (x2 - radius, y1 + radius), (radius, radius), 270, 0, 90, color, thickness)
-        cv2.ellipse(overlay, (x1 + radius, y2 - radius), (radius, radius), 90, 0, 90, color, thickness)
-        cv2.ellipse(overlay, (x2 - radius, y2 - radius), (radius, radius), 0, 0, 90, color, thickness)
-        
-        # Blend with original
-        cv2.addWeighted(overlay, alpha, img, 1 - alpha, 0, img)
+        Args:
+            feedback: Feedback message
+            
+        Returns:
+            Tuple of (is_positive, is_warning)
+        """
+        return ('✓' in feedback or '💪' in feedback), '!' in feedback
     
-    @staticmethod
     def draw_info_panel(
+        self,
         img: np.ndarray,
         exercise_name: str,
         rep_count: int,
@@ -181,6 +231,9 @@ class UIRenderer:
         """
         Draw the main information panel.
         
+        The panel is rasterized into an overlay layer only when its
+        contents change and composited onto the frame in a single pass.
+        
         Args:
             img: Image to draw on
             exercise_name: Current exercise name
@@ -193,52 +246,82 @@ class UIRenderer:
         """
         h, w = img.shape[:2]
         
+        key = (exercise_name, rep_count, stage, feedback, int(form_score), voice_enabled)
+        cached_key, layer = self._info_panel_cache
+        if cached_key != key:
+            layer = UIRenderer._build_info_panel(
+                exercise_name, rep_count, stage, feedback, form_score, voice_enabled
+            )
+            self._info_panel_cache = (key, layer)
+        layer.composite(img, (10, 10))
+        
+        # FPS (top right)
+        cv2.putText(
+            img, f"FPS: {fps}",
+            (w - 100, 30),
+            cv2.FONT_HERSHEY_SIMPLEX,
+            0.6, UIRenderer.COLORS['green'], 2
+        )
+    
+    @staticmethod
+    def _build_info_panel(
+        exercise_name: str,
+        rep_count: int,
+        stage: str,
+        feedback: str,
+        form_score: float,
+        voice_enabled: bool
+    ) -> 'OverlayLayer':
+        """
+        Rasterize the information panel (everything except FPS) into a layer.
+        
+        Layer coordinates are relative to the panel's top-left corner (10, 10).
+        
+        Returns:
+            Overlay layer for the panel
+        """
         # Main panel background (left side)
         panel_width = 300
         panel_height = 280
-        UIRenderer.draw_rounded_rect(
-            img,
-            (10, 10),
-            (panel_width, panel_height),
-            UIRenderer.COLORS['black'],
-            alpha=0.6
+        layer = OverlayLayer(
+            panel_width - 10, panel_height - 10, UIRenderer.COLORS['black'], alpha=0.6
         )
         
         # Exercise name
-        cv2.putText(
-            img, exercise_name.upper(),
-            (20, 45),
+        layer.put_text(
+            exercise_name.upper(),
+            (10, 35),
             cv2.FONT_HERSHEY_SIMPLEX,
             0.8, UIRenderer.COLORS['blue'], 2
         )
         
         # Rep counter (large)
-        cv2.putText(
-            img, "REPS",
-            (20, 80),
+        layer.put_text(
+            "REPS",
+            (10, 70),
             cv2.FONT_HERSHEY_SIMPLEX,
             0.5, UIRenderer.COLORS['white'], 1
         )
-        cv2.putText(
-            img, str(rep_count),
-            (20, 140),
+        layer.put_text(
+            str(rep_count),
+            (10, 130),
             cv2.FONT_HERSHEY_SIMPLEX,
             2.0, UIRenderer.COLORS['green'], 3
         )
         
         # Stage indicator
         stage_color = UIRenderer.COLORS['yellow'] if stage.lower() == 'up' else UIRenderer.COLORS['orange']
-        cv2.putText(
-            img, f"Stage: {stage.upper()}",
-            (120, 120),
+        layer.put_text(
+            f"Stage: {stage.upper()}",
+            (110, 110),
             cv2.FONT_HERSHEY_SIMPLEX,
             0.6, stage_color, 2
         )
         
         # Form score bar
-        cv2.putText(
-            img, f"Form: {int(form_score)}%",
-            (20, 175),
+        layer.put_text(
+            f"Form: {int(form_score)}%",
+            (10, 165),
             cv2.FONT_HERSHEY_SIMPLEX,
             0.5, UIRenderer.COLORS['white'], 1
         )
@@ -246,29 +329,27 @@ class UIRenderer:
         # Score bar background
         bar_width = 250
         bar_height = 20
-        cv2.rectangle(img, (20, 185), (20 + bar_width, 185 + bar_height), (50, 50, 50), -1)
+        layer.rectangle((10, 175), (10 + bar_width, 175 + bar_height), (50, 50, 50))
         
         # Score bar fill
         fill_width = int(bar_width * form_score / 100)
-        score_color = (
-            UIRenderer.COLORS['green'] if form_score >= 70
-            else UIRenderer.COLORS['yellow'] if form_score >= 40
-            else UIRenderer.COLORS['red']
-        )
-        cv2.rectangle(img, (20, 185), (20 + fill_width, 185 + bar_height), score_color, -1)
+        score_color = UIRenderer.score_color(form_score)
+        layer.rectangle((10, 175), (10 + fill_width, 175 + bar_height), score_color)
         
         # Feedback message
-        feedback_color = (
-            UIRenderer.COLORS['green'] if form_score >= 70 or '✓' in feedback or '💪' in feedback
-            else UIRenderer.COLORS['red'] if form_score < 40 or '!' in feedback
-            else UIRenderer.COLORS['yellow']
-        )
+        is_positive, is_warning = UIRenderer.classify_feedback(feedback)
+        if form_score >= 70 or is_positive:
+            feedback_color = UIRenderer.COLORS['green']
+        elif form_score < 40 or is_warning:
+            feedback_color = UIRenderer.COLORS['red']
+        else:
+            feedback_color = UIRenderer.COLORS['yellow']
         
         # Wrap long feedback
         feedback_text = feedback[:35] + "..." if len(feedback) > 35 else feedback
-        cv2.putText(
-            img, feedback_text,
-            (20, 235),
+        layer.put_text(
+            feedback_text,
+            (10, 225),
             cv2.FONT_HERSHEY_SIMPLEX,
             0.5, feedback_color, 1
         )
@@ -276,26 +357,22 @@ class UIRenderer:
         # Voice indicator
         voice_text = "Voice: ON" if voice_enabled else "Voice: OFF"
         voice_color = UIRenderer.COLORS['green'] if voice_enabled else UIRenderer.COLORS['red']
-        cv2.putText(
-            img, voice_text,
-            (20, 265),
+        layer.put_text(
+            voice_text,
+            (10, 255),
             cv2.FONT_HERSHEY_SIMPLEX,
             0.4, voice_color, 1
         )
         
-        # FPS (top right)
-        cv2.putText(
-            img, f"FPS: {fps}",
-            (w - 100, 30),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            0.6, UIRenderer.COLORS['green'], 2
-        )
+        return layer.finish()
     
-    @staticmethod
-    def draw_controls_help(img: np.ndarray):
+    def draw_controls_help(self, img: np.ndarray):
         """
         Draw keyboard controls help.
         
+        The help bar only depends on the frame size, so its labels are
+        rasterized into a layer once and composited every frame.
+        
         Args:
             img: Image to draw on
         """
@@ -303,38 +380,165 @@ class UIRenderer:
         
         # Help panel (bottom)
         panel_y = h - 80
-        UIRenderer.draw_rounded_rect(
-            img,
-            (10, panel_y),
-            (w - 10, h - 10),
-            UIRenderer.COLORS['black'],
-            alpha=0.5
-        )
         
-        controls = [
-            "1: Bicep Curl",
-            "2: Squat", 
-            "3: Push-up",
-            "4: Shoulder Press",
-            "5: Lateral Raise",
-            "6: Front Raise",
-            "7: Shrug",
-            "8: Tricep Ext",
-            "R: Reset",
-            "V: Voice",
-            "Q: Quit"
-        ]
-        
-        x_start = 30
-        x_spacing = (w - 60) // len(controls)
-        
-        for i, control in enumerate(controls):
-            cv2.putText(
-                img, control,
-                (x_start + i * x_spacing, panel_y + 45),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.45, UIRenderer.COLORS['white'], 1
-            )
+        layer = self._help_cache.get((w, h))
+        if layer is None:
+            layer = OverlayLayer(w - 20, 70, UIRenderer.COLORS['black'], alpha=0.5)
+            
+            controls = [
+                "1: Bicep Curl",
+                "2: Squat", 
+                "3: Push-up",
+                "4: Shoulder Press",
+                "5: Lateral Raise",
+                "6: Front Raise",
+                "7: Shrug",
+                "8: Tricep Ext",
+                "R: Reset",
+                "V: Voice",
+                "Q: Quit"
+            ]
+            
+            x_start = 20
+            x_spacing = (w - 60) // len(controls)
+            
+            for i, control in enumerate(controls):
+                layer.put_text(
+                    control,
+                    (x_start + i * x_spacing, 45),
+                    cv2.FONT_HERSHEY_SIMPLEX,
+                    0.45, UIRenderer.COLORS['white'], 1
+                )
+            
+            layer = layer.finish()
+            self._help_cache[(w, h)] = layer
+        
+        layer.composite(img, (10, panel_y))
+
+
+class OverlayLayer:
+    """
+    Pre-rendered translucent panel with opaque contents.
+    
+    Stores a premultiplied color buffer and a per-pixel keep factor so the
+    whole panel is composited with one multiply and one add over its region
+    of interest only: ``frame = frame * keep + color``. Text and shapes
+    drawn into the layer stay opaque on top of the translucent background,
+    exactly as if they were drawn onto the frame after blending the
+    background.
+    """
+    
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        color: Tuple[int, int, int],
+        alpha: float = 0.7,
+        radius: int = 10
+    ):
+        """
+        Start a layer with a rounded rectangle background.
+        
+        Args:
+            width: Background width in pixels (pt2.x - pt1.x)
+            height: Background height in pixels (pt2.y - pt1.y)
+            color: Background BGR color
+            alpha: Background transparency (0-1)
+            radius: Corner radius
+        """
+        mask = OverlayLayer._rounded_rect_mask(width, height, radius)
+        self._bg_alpha = mask * np.float32(alpha)
+        self.color = (
+            np.array(color, dtype=np.float32) * self._bg_alpha[..., None] + 0.5
+        ).astype(np.uint8)
+        self.coverage = np.zeros(mask.shape, dtype=np.uint8)
+        self.keep: Optional[np.ndarray] = None
+    
+    @staticmethod
+    def _rounded_rect_mask(width: int, height: int, radius: int) -> np.ndarray:
+        """
+        Build the boolean shape mask of a filled rounded rectangle.
+        
+        Args:
+            width: Rectangle width in pixels (pt2.x - pt1.x)
+            height: Rectangle height in pixels (pt2.y - pt1.y)
+            radius: Corner radius
+            
+        Returns:
+            Mask of shape (height + 1, width + 1) marking the rectangle pixels
+        """
+        mask = np.zeros((height + 1, width + 1), dtype=np.uint8)
+        
+        # Draw rounded rectangle shape into the mask
+        cv2.rectangle(mask, (radius, 0), (width - radius, height), 255, -1)
+        cv2.rectangle(mask, (0, radius), (width, height - radius), 255, -1)
+        
+        # Draw corners
+        cv2.ellipse(mask, (radius, radius), (radius, radius), 180, 0, 90, 255, -1)
+        cv2.ellipse(mask, (width - radius, radius), (radius, radius), 270, 0, 90, 255, -1)
+        cv2.ellipse(mask, (radius, height - radius), (radius, radius), 90, 0, 90, 255, -1)
+        cv2.ellipse(mask, (width - radius, height - radius), (radius, radius), 0, 0, 90, 255, -1)
+        
+        return mask.astype(bool)
+    
+    def put_text(
+        self,
+        text: str,
+        org: Tuple[int, int],
+        font: int,
+        font_scale: float,
+        color: Tuple[int, int, int],
+        thickness: int = 1
+    ):
+        """Draw opaque text into the layer (arguments as in cv2.putText)."""
+        cv2.putText(self.color, text, org, font, font_scale, color, thickness)
+        cv2.putText(self.coverage, text, org, font, font_scale, 255, thickness)
+    
+    def rectangle(
+        self,
+        pt1: Tuple[int, int],
+        pt2: Tuple[int, int],
+        color: Tuple[int, int, int]
+    ):
+        """Draw an opaque filled rectangle into the layer."""
+        cv2.rectangle(self.color, pt1, pt2, color, -1)
+        cv2.rectangle(self.coverage, pt1, pt2, 255, -1)
+    
+    def finish(self) -> 'OverlayLayer':
+        """
+        Compute the keep factor once drawing is done.
+        
+        Returns:
+            The layer itself, ready to composite
+        """
+        opacity = self.coverage.astype(np.float32) / 255.0
+        keep = (1 - self._bg_alpha) * (1 - opacity) * 255.0 + 0.5
+        self.keep = cv2.merge([keep.astype(np.uint8)] * 3)
+        return self
+    
+    def composite(self, img: np.ndarray, pt: Tuple[int, int]):
+        """
+        Composite the layer onto an image in place.
+        
+        Args:
+            img: Image to draw on
+            pt: Position of the layer's top-left corner
+        """
+        x1, y1 = pt
+        
+        # Clip to image bounds
+        h, w = img.shape[:2]
+        lh, lw = self.keep.shape[:2]
+        cx1, cy1 = max(x1, 0), max(y1, 0)
+        cx2, cy2 = min(x1 + lw, w), min(y1 + lh, h)
+        if cx1 >= cx2 or cy1 >= cy2:
+            return
+        
+        roi = img[cy1:cy2, cx1:cx2]
+        keep = self.keep[cy1 - y1:cy2 - y1, cx1 - x1:cx2 - x1]
+        color = self.color[cy1 - y1:cy2 - y1, cx1 - x1:cx2 - x1]
+        cv2.multiply(roi, keep, dst=roi, scale=1 / 255.0)
+        cv2.add(roi, color, dst=roi)
 
 
 class FitnessCoachApp:
@@ -342,8 +546,18 @@ class FitnessCoachApp:
     Main fitness coach application.
     
     Orchestrates pose detection, exercise tracking, and UI rendering.
+    
+    The main loop is split into three pipeline stages connected by small
+    bounded queues so capture, inference and display overlap. The reader
+    drops the stalest queued frame when processing falls behind:
+    - reader thread: webcam capture + optional mirror flip
+    - processing thread: pose detection, exercise tracking, UI overlay
+    - main thread: cv2.imshow + keyboard handling (HighGUI needs the main thread)
     """
     
+    # Maximum frames buffered between pipeline stages
+    QUEUE_SIZE = 2
+    
     EXERCISES = {
         'bicep_curl': BicepCurlTracker,
         'squat': SquatTracker,
@@ -355,13 +569,32 @@ class FitnessCoachApp:
         'tricep_extension': TricepExtensionTracker
     }
     
+    # Number keys for switching exercises
+    EXERCISE_KEYS = {
+        ord('1'): 'bicep_curl',
+        ord('2'): 'squat',
+        ord('3'): 'pushup',
+        ord('4'): 'shoulder_press',
+        ord('5'): 'lateral_raise',
+        ord('6'): 'front_raise',
+        ord('7'): 'shoulder_shrug',
+        ord('8'): 'tricep_extension'
+    }
+    
+    # Landmark overlay modes
+    OVERLAYS = ('skeleton', 'required', 'none')
+    
     def __init__(
         self,
         starting_exercise: str = 'bicep_curl',
         camera_id: int = 0,
         width: int = 1280,
         height: int = 720,
-        voice_enabled: bool = False
+        voice_enabled: bool = False,
+        mirror: bool = True,
+        infer_width: Optional[int] = 640,
+        model_complexity: int = 1,
+        overlay: str = 'skeleton'
     ):
         """
         Initialize the fitness coach application.
@@ -372,11 +605,33 @@ class FitnessCoachApp:
             width: Video width
             height: Video height
             voice_enabled: Enable voice feedback
+            mirror: Mirror the video horizontally (skipping saves a full-frame pass)
+            infer_width: Width frames are downscaled to for pose detection
+                (None or 0 to detect on the full-resolution frame)
+            model_complexity: MediaPipe pose model (0 = lite, 1 = full,
+                2 = heavy); lite is several times faster on CPU
+            overlay: Landmark overlay: 'skeleton' (full), 'required' (only the
+                current exercise's landmarks) or 'none'
+            
+        Raises:
+            ValueError: If overlay is not one of OVERLAYS
         """
+        if overlay not in self.OVERLAYS:
+            raise ValueError(f"Unknown overlay: {overlay}. Valid overlays: {list(self.OVERLAYS)}")
+        
+        # The per-frame OpenCV ops are small and already run on their own
+        # pipeline threads; OpenCV's worker pool would only compete with
+        # MediaPipe inference for cores
+        cv2.setNumThreads(1)
+
         # Initialize pose detector
+        # Landmarks are normalized, so detecting on a downscaled frame still
+        # maps onto the full-resolution frame used for display and drawing
         self.detector = PoseDetector(
+            model_complexity=model_complexity,
             min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
+            min_tracking_confidence=0.5,
+            inference_width=infer_width
         )
         
         # Initialize webcam
@@ -386,15 +641,14 @@ class FitnessCoachApp:
             height=height
         )
         
-        # Initialize exercise trackers
-        self.trackers = {
-            name: tracker_class()
-            for name, tracker_class in self.EXERCISES.items()
-        }
+        # Exercise trackers, created on first use
+        self.trackers: Dict[str, BaseExerciseTracker] = {}
         
         # Current exercise
         self.current_exercise = starting_exercise
-        self.tracker = self.trackers.get(starting_exercise, self.trackers['bicep_curl'])
+        self.tracker = self._get_tracker(
+            starting_exercise if starting_exercise in self.EXERCISES else 'bicep_curl'
+        )
         
         # Initialize voice feedback
         self.voice = VoiceFeedback()
@@ -402,12 +656,30 @@ class FitnessCoachApp:
         
         # UI renderer
         self.ui = UIRenderer()
+        self.mirror = mirror
+        self.overlay = overlay
         
         # State
         self.running = False
         self.last_rep_count = 0
         self.last_feedback = ""
         
+        # Pipeline queues (reader -> processing -> display)
+        self._read_q: queue.Queue = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self._draw_q: queue.Queue = queue.Queue(maxsize=self.QUEUE_SIZE)
+        
+        # Guards tracker switching/reset against the processing thread
+        self._tracker_lock = threading.Lock()
+        
+        # Result shown while no pose is detected (updated in place)
+        self._no_pose_result = ExerciseResult(
+            rep_count=0,
+            stage=self.tracker.stage,
+            feedback="No pose detected - stand in frame",
+            form_score=0,
+            is_valid_pose=False
+        )
+        
     def switch_exercise(self, exercise_name: str):
         """
         Switch to a different exercise.
@@ -415,21 +687,40 @@ class FitnessCoachApp:
         Args:
             exercise_name: Name of the exercise to switch to
         """
-        if exercise_name in self.trackers:
-            self.current_exercise = exercise_name
-            self.tracker = self.trackers[exercise_name]
-            self.tracker.reset()
-            self.last_rep_count = 0
+        if exercise_name in self.EXERCISES:
+            with self._tracker_lock:
+                self.current_exercise = exercise_name
+                self.tracker = self._get_tracker(exercise_name)
+                self.tracker.reset()
+                self.last_rep_count = 0
             
             if self.voice.enabled:
                 self.voice.speak(f"Switched to {self.tracker.exercise_name}", force=True)
                 
             print(f"Switched to: {self.tracker.exercise_name}")
     
+    def _get_tracker(self, exercise_name: str) -> BaseExerciseTracker:
+        """
+        Get the tracker for an exercise, creating it on first use.
+        
+        Args:
+            exercise_name: Name of the exercise (must be in EXERCISES)
+            
+        Returns:
+            Exercise tracker
+        """
+        tracker = self.trackers.get(exercise_name)
+        if tracker is None:
+            tracker = self.trackers[exercise_name] = self.EXERCISES[exercise_name]()
+            # The UI only shows the core result fields
+            tracker.emit_additional_data = False
+        return tracker
+    
     def reset_counter(self):
         """Reset the current exercise counter."""
-        self.tracker.reset()
-        self.last_rep_count = 0
+        with self._tracker_lock:
+            self.tracker.reset()
+            self.last_rep_count = 0
         
         if self.voice.enabled:
             self.voice.speak("Counter reset", force=True)
@@ -451,73 +742,18 @@ class FitnessCoachApp:
         print("Press 'Q' to quit")
         print("="*50 + "\n")
         
+        reader = threading.Thread(target=self._reader_loop, daemon=True)
+        processor = threading.Thread(target=self._process_loop, daemon=True)
+        reader.start()
+        processor.start()
+        
         try:
             while self.running:
-                # Read frame
-                success, frame = self.webcam.read()
-                if not success:
-                    print("Failed to read frame")
+                try:
+                    frame = self._draw_q.get(timeout=0.1)
+                except queue.Empty:
                     continue
                 
-                # Flip frame horizontally for mirror effect
-                frame = cv2.flip(frame, 1)
-                
-                # Get frame dimensions
-                h, w = frame.shape[:2]
-                
-                # Process frame with pose detector
-                frame = self.detector.process_frame(frame)
-                
-                # Draw landmarks
-                frame = self.detector.draw_landmarks(frame)
-                
-                # Process exercise if pose detected
-                result = ExerciseResult(
-                    rep_count=self.tracker.rep_count,
-                    stage=self.tracker.stage,
-                    feedback="No pose detected - stand in frame",
-                    form_score=0,
-                    is_valid_pose=False
-                )
-                
-                if self.detector.is_pose_detected():
-                    # Get all landmarks
-                    landmarks = self.detector.get_all_landmarks()
-                    
-                    # Process with exercise tracker
-                    result = self.tracker.process(landmarks, w, h)
-                    
-                    # Voice feedback for reps
-                    if result.rep_count > self.last_rep_count:
-                        self.last_rep_count = result.rep_count
-                        if self.voice.enabled:
-                            self.voice.speak(str(result.rep_count))
-                    
-                    # Voice feedback for form issues
-                    if (result.feedback != self.last_feedback and 
-                        result.form_score < 70 and 
-                        '!' in result.feedback):
-                        self.last_feedback = result.feedback
-                        if self.voice.enabled:
-                            # Clean feedback for speech
-                            clean_feedback = result.feedback.replace('!', '').replace('📍', '').replace('🚫', '').replace('⬇️', '').replace('⬆️', '')
-                            self.voice.speak(clean_feedback)
-                
-                # Draw UI
-                self.ui.draw_info_panel(
-                    frame,
-                    exercise_name=self.tracker.exercise_name,
-                    rep_count=result.rep_count,
-                    stage=result.stage,
-                    feedback=result.feedback,
-                    form_score=result.form_score,
-                    fps=int(self.detector.fps),
-                    voice_enabled=self.voice.enabled
-                )
-                
-                # Draw controls help
-                self.ui.draw_controls_help(frame)
-                
                 # Display frame
                 cv2.imshow("Fitness Coach", frame)
                 
@@ -528,8 +764,141 @@ class FitnessCoachApp:
         except KeyboardInterrupt:
             print("\nInterrupted by user")
         finally:
+            self.running = False
+            reader.join(timeout=1.0)
+            processor.join(timeout=1.0)
             self._cleanup()
     
+    def _put(self, q: queue.Queue, item) -> bool:
+        """
+        Put an item on a pipeline queue, blocking while the queue is full.
+        
+        Args:
+            q: Destination queue
+            item: Item to enqueue
+            
+        Returns:
+            True if the item was queued, False if the app stopped first
+        """
+        while self.running:
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def _put_latest(self, q: queue.Queue, item):
+        """
+        Put an item on a pipeline queue, dropping the stalest item if full.
+        
+        Args:
+            q: Destination queue
+            item: Item to enqueue
+        """
+        while True:
+            try:
+                q.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    q.get_nowait()
+                except queue.Empty:
+                    pass
+    
+    def _reader_loop(self):
+        """Pipeline stage 1: capture and mirror frames from the webcam."""
+        while self.running:
+            success, frame = self.webcam.read()
+            if not success:
+                print("Failed to read frame")
+                continue
+            
+            # Flip frame horizontally for mirror effect (in place)
+            if self.mirror:
+                cv2.flip(frame, 1, dst=frame)
+            
+            # Replace stale frames so processing always sees the newest one
+            self._put_latest(self._read_q, frame)
+    
+    def _process_loop(self):
+        """Pipeline stage 2: pose detection, exercise tracking and UI overlay."""
+        while self.running:
+            try:
+                frame = self._read_q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            
+            frame = self._process_frame(frame)
+            self._put(self._draw_q, frame)
+    
+    def _process_frame(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Run detection and tracking on a frame and draw the UI on it.
+        
+        Args:
+            frame: Mirrored BGR frame from the reader stage
+            
+        Returns:
+            Frame ready for display
+        """
+        # Get frame dimensions
+        h, w = frame.shape[:2]
+        
+        # Detect pose; landmarks is a normalized (33, 4) array or None
+        landmarks = self.detector.step(frame)
+        
+        with self._tracker_lock:
+            tracker = self.tracker
+            
+            # Draw landmarks
+            if self.overlay == 'skeleton':
+                self.detector.draw_landmarks(frame)
+            elif self.overlay == 'required':
+                self.detector.draw_landmarks(frame, subset=tracker.required_landmark_indices)
+            
+            # Process exercise if pose detected
+            result = self._no_pose_result
+            result.rep_count = tracker.rep_count
+            result.stage = tracker.stage
+            
+            if landmarks is not None:
+                # Process with exercise tracker
+                result = tracker.process_array(landmarks, w, h)
+                
+                # Voice feedback for reps
+                if result.rep_count > self.last_rep_count:
+                    self.last_rep_count = result.rep_count
+                    if self.voice.enabled:
+                        self.voice.speak(str(result.rep_count))
+                
+                # Voice feedback for form issues
+                if (result.feedback != self.last_feedback and 
+                    result.form_score < 70 and 
+                    '!' in result.feedback):
+                    self.last_feedback = result.feedback
+                    if self.voice.enabled:
+                        # Clean feedback for speech
+                        clean_feedback = result.feedback.replace('!', '').replace('📍', '').replace('🚫', '').replace('⬇️', '').replace('⬆️', '')
+                        self.voice.speak(clean_feedback)
+        
+        # Draw UI
+        self.ui.draw_info_panel(
+            frame,
+            exercise_name=tracker.exercise_name,
+            rep_count=result.rep_count,
+            stage=result.stage,
+            feedback=result.feedback,
+            form_score=result.form_score,
+            fps=int(self.detector.fps),
+            voice_enabled=self.voice.enabled
+        )
+        
+        # Draw controls help
+        self.ui.draw_controls_help(frame)
+        
+        return frame
+    
     def _handle_key(self, key: int):
         """
         Handle keyboard input.
@@ -537,24 +906,14 @@ class FitnessCoachApp:
         Args:
             key: Key code from cv2.waitKey
         """
-        if key == ord('q') or key == ord('Q'):
+        if key == 0xFF:  # No key pressed
+            return
+        
+        exercise_name = self.EXERCISE_KEYS.get(key)
+        if exercise_name is not None:
+            self.switch_exercise(exercise_name)
+        elif key == ord('q') or key == ord('Q'):
             self.running = False
-        elif key == ord('1'):
-            self.switch_exercise('bicep_curl')
-        elif key == ord('2'):
-            self.switch_exercise('squat')
-        elif key == ord('3'):
-            self.switch_exercise('pushup')
-        elif key == ord('4'):
-            self.switch_exercise('shoulder_press')
-        elif key == ord('5'):
-            self.switch_exercise('lateral_raise')
-        elif key == ord('6'):
-            self.switch_exercise('front_raise')
-        elif key == ord('7'):
-            self.switch_exercise('shoulder_shrug')
-        elif key == ord('8'):
-            self.switch_exercise('tricep_extension')
         elif key == ord('r') or key == ord('R'):
             self.reset_counter()
         elif key == ord('v') or key == ord('V'):
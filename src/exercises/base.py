@@ -8,10 +8,15 @@ the required methods for consistent interface.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Dict, Tuple, Optional, List
+from collections import deque
+from typing import Deque, Dict, Tuple, Optional, List, Set, Union
 from enum import Enum
 
+import numpy as np
+
+from ..utils.landmarks import LANDMARK_INDICES, VISIBILITY
+from ..utils._kernels import joint_angle
+
 
 class ExerciseStage(Enum):
     """Enum for exercise stages."""
@@ -22,10 +27,13 @@ class ExerciseStage(Enum):
     NEUTRAL = "neutral"
 
 
-@dataclass
 class ExerciseResult:
     """
-    Data class for exercise tracking results.
+    Exercise tracking result.
+    
+    Each tracker owns one instance and updates it in place every frame
+    (see BaseExerciseTracker._update_result), so callers that keep a
+    result across frames should copy the fields they need.
     
     Attributes:
         rep_count: Number of completed repetitions
@@ -33,18 +41,59 @@ class ExerciseResult:
         feedback: Current feedback message
         form_score: Form quality score (0-100)
         is_valid_pose: Whether the required landmarks are visible
-        additional_data: Any additional exercise-specific data
+        additional_data: Any additional exercise-specific data (or None)
+    """
+    
+    __slots__ = (
+        'rep_count', 'stage', 'feedback', 'form_score',
+        'is_valid_pose', 'additional_data'
+    )
+    
+    def __init__(
+        self,
+        rep_count: int,
+        stage: str,
+        feedback: str,
+        form_score: float,
+        is_valid_pose: bool = True,
+        additional_data: Optional[Dict] = None
+    ):
+        self.rep_count = rep_count
+        self.stage = stage
+        self.feedback = feedback
+        self.form_score = form_score
+        self.is_valid_pose = is_valid_pose
+        self.additional_data = additional_data
+    
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"ExerciseResult({fields})"
+
+
+class RequiredLandmarks(dict):
     """
-    rep_count: int
-    stage: str
-    feedback: str
-    form_score: float
-    is_valid_pose: bool = True
-    additional_data: Dict = None
-    
-    def __post_init__(self):
-        if self.additional_data is None:
-            self.additional_data = {}
+    Landmark dict built by process_array() from the required rows only.
+    
+    Reading a landmark the tracker did not declare in
+    get_required_landmarks() raises a KeyError naming the tracker, instead
+    of a bare KeyError with just the landmark name.
+    
+    process_array() also records the result of its vectorized visibility
+    check, so check_landmarks_visibility() does not repeat it per landmark.
+    
+    Attributes:
+        owner: Name of the tracker class the dict was built for
+        threshold: Visibility threshold the check was run with
+        missing: Required landmarks below that threshold
+    """
+    
+    __slots__ = ('owner', 'threshold', 'missing')
+    
+    def __missing__(self, name: str):
+        raise KeyError(
+            f"{name!r} is not in {self.owner}.get_required_landmarks(); "
+            f"process_array() only passes declared landmarks"
+        )
 
 
 class BaseExerciseTracker(ABC):
@@ -55,15 +104,44 @@ class BaseExerciseTracker(ABC):
     - process(): Process landmarks and return ExerciseResult
     - get_required_landmarks(): Return list of required landmark names
     - reset(): Reset the tracker state
+    
+    Landmarks can also be passed as a (33, 4) array via process_array(),
+    which hands process() only the landmarks named by
+    get_required_landmarks().
+    
+    Built-in trackers declare __slots__ for their per-instance state;
+    subclasses that do not simply get a regular __dict__.
     """
     
+    # Number of distinct recent feedback messages kept in feedback_history
+    FEEDBACK_HISTORY_SIZE = 5
+    
+    # Minimum landmark visibility for a pose to count as valid
+    VISIBILITY_THRESHOLD = 0.5
+    
+    __slots__ = (
+        'rep_count', 'stage', 'feedback', 'form_score', 'feedback_history',
+        '_feedback_set', '_required_cache', '_result', 'emit_additional_data'
+    )
+    
     def __init__(self):
         """Initialize base tracker."""
         self.rep_count = 0
         self.stage = "neutral"
         self.feedback = ""
         self.form_score = 100.0
-        self.feedback_history: List[str] = []
+        self.feedback_history: Deque[str] = deque(maxlen=self.FEEDBACK_HISTORY_SIZE)
+        self._feedback_set: Set[str] = set()
+        
+        # Cached (names, array indices) of required landmarks
+        self._required_cache: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        
+        # Result object reused across frames
+        self._result = ExerciseResult(rep_count=0, stage=self.stage, feedback="", form_score=100.0)
+        
+        # Whether results carry exercise-specific additional_data; callers
+        # that never read it can turn this off to skip building it per frame
+        self.emit_additional_data = True
         
     @abstractmethod
     def process(
@@ -90,11 +168,97 @@ class BaseExerciseTracker(ABC):
         """
         Get list of landmark names required for this exercise.
         
+        This is also the full set of landmarks process() may read: when
+        called through process_array(), undeclared landmarks are not
+        passed in and looking one up raises KeyError.
+        
         Returns:
             List of landmark names (e.g., ["left_shoulder", "left_elbow", "left_wrist"])
         """
         pass
     
+    def _update_result(
+        self,
+        rep_count: int,
+        stage: str,
+        feedback: str,
+        form_score: float,
+        is_valid_pose: bool = True,
+        additional_data: Optional[Dict] = None
+    ) -> ExerciseResult:
+        """
+        Update the tracker's reusable result in place.
+        
+        Args:
+            rep_count: Number of completed repetitions
+            stage: Current stage of the exercise
+            feedback: Current feedback message
+            form_score: Form quality score (0-100)
+            is_valid_pose: Whether the required landmarks are visible
+            additional_data: Any additional exercise-specific data
+            
+        Returns:
+            The tracker's ExerciseResult
+        """
+        result = self._result
+        result.rep_count = rep_count
+        result.stage = stage
+        result.feedback = feedback
+        result.form_score = form_score
+        result.is_valid_pose = is_valid_pose
+        result.additional_data = additional_data
+        return result
+    
+    def process_array(
+        self,
+        landmarks: np.ndarray,
+        frame_width: int,
+        frame_height: int
+    ) -> ExerciseResult:
+        """
+        Process a landmark array and update exercise state.
+        
+        Only the rows for the required landmarks are converted to the
+        name-keyed form used by process(); see get_required_landmarks().
+        
+        Args:
+            landmarks: Array of shape (33, 4) with (x, y, z, visibility) rows
+            frame_width: Width of the video frame
+            frame_height: Height of the video frame
+            
+        Returns:
+            ExerciseResult with current state
+        """
+        _, indices = self._required_landmark_indices()
+        rows = landmarks[indices].tolist()
+        required = RequiredLandmarks(zip(self.get_required_landmarks(), map(tuple, rows)))
+        required.owner = type(self).__name__
+        
+        # Check visibility on the array in one comparison; process() reuses it
+        required.threshold = self.VISIBILITY_THRESHOLD
+        _, required.missing = self.check_landmarks_visibility(landmarks)
+        return self.process(required, frame_width, frame_height)
+    
+    @property
+    def required_landmark_indices(self) -> np.ndarray:
+        """Landmark array row indices of get_required_landmarks(), in order."""
+        return self._required_landmark_indices()[1]
+    
+    def _required_landmark_indices(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the required landmark names and their landmark array row indices.
+        
+        Returns:
+            Tuple of (names, indices) arrays
+        """
+        if self._required_cache is None:
+            names = self.get_required_landmarks()
+            self._required_cache = (
+                np.array(names),
+                np.array([LANDMARK_INDICES[name] for name in names], dtype=np.intp)
+            )
+        return self._required_cache
+    
     def reset(self):
         """Reset the tracker to initial state."""
         self.rep_count = 0
@@ -102,59 +266,93 @@ class BaseExerciseTracker(ABC):
         self.feedback = ""
         self.form_score = 100.0
         self.feedback_history.clear()
+        self._feedback_set.clear()
         
     def check_landmarks_visibility(
         self,
-        landmarks: Dict[str, Tuple[float, float, float, float]],
-        threshold: float = 0.5
+        landmarks: Union[Dict[str, Tuple[float, float, float, float]], np.ndarray],
+        threshold: float = VISIBILITY_THRESHOLD
     ) -> Tuple[bool, List[str]]:
         """
         Check if all required landmarks are visible.
         
+        Landmarks from process_array() were already checked against the
+        array, so their recorded result is returned without a lookup per
+        landmark.
+        
         Args:
-            landmarks: Dictionary of landmarks
+            landmarks: Dictionary of landmarks or a (33, 4) landmark array
             threshold: Minimum visibility threshold
             
         Returns:
             Tuple of (is_valid, list_of_missing_landmarks)
         """
-        required = self.get_required_landmarks()
-        missing = []
+        if isinstance(landmarks, np.ndarray):
+            names, indices = self._required_landmark_indices()
+            hidden = landmarks[indices, VISIBILITY] < threshold
+            if not hidden.any():
+                return True, []
+            return False, names[hidden].tolist()
+        
+        if isinstance(landmarks, RequiredLandmarks) and landmarks.threshold == threshold:
+            return not landmarks.missing, landmarks.missing
         
-        for name in required:
-            if name not in landmarks:
-                missing.append(name)
-            elif landmarks[name][3] < threshold:  # visibility is 4th element
-                missing.append(name)
-                
-        return len(missing) == 0, missing
+        # Visibility is the 4th element; absent landmarks count as missing
+        missing = [
+            name for name in self.get_required_landmarks()
+            if name not in landmarks or landmarks[name][3] < threshold
+        ]
+        return not missing, missing
+    
+    @staticmethod
+    def _calculate_angle(
+        point1: Tuple[float, ...],
+        point2: Tuple[float, ...],
+        point3: Tuple[float, ...]
+    ) -> float:
+        """
+        Calculate the 2D angle at point2 between point1 and point3.
+        
+        Args:
+            point1: First landmark (x, y, ...)
+            point2: Vertex landmark (e.g. the elbow)
+            point3: Third landmark
+            
+        Returns:
+            Angle in degrees (0-180)
+        """
+        return joint_angle(point1[0], point1[1], point2[0], point2[1], point3[0], point3[1])
     
     def _add_feedback(self, feedback: str, is_positive: bool = False):
         """
         Add feedback message and track history.
         
+        Only non-empty messages not already among the recent ones are
+        recorded; a set mirrors the history for O(1) membership checks.
+        
         Args:
             feedback: Feedback message
             is_positive: Whether this is positive feedback
         """
         self.feedback = feedback
-        if feedback and feedback not in self.feedback_history[-5:] if self.feedback_history else True:
-            self.feedback_history.append(feedback)
+        if feedback and feedback not in self._feedback_set:
+            history = self.feedback_history
+            if len(history) == history.maxlen:
+                self._feedback_set.discard(history[0])
+            history.append(feedback)
+            self._feedback_set.add(feedback)
             
-    def _calculate_form_score(self, penalties: List[float]) -> float:
+    def _calculate_form_score(self, penalty: float) -> float:
         """
         Calculate form score based on penalties.
         
         Args:
-            penalties: List of penalty values (each 0-100)
+            penalty: Sum of the frame's penalty values (each 0-100)
             
         Returns:
             Form score (0-100)
         """
-        if not penalties:
-            return 100.0
-        total_penalty = sum(penalties)
-        return max(0.0, 100.0 - total_penalty)
+        return max(0.0, 100.0 - penalty)
     
     @property
     def exercise_name(self) -> str:
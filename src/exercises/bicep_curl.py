@@ -16,9 +16,9 @@ Rep counting logic:
 """
 
 from typing import Dict, Tuple, List, Optional
-import numpy as np
 
 from .base import BaseExerciseTracker, ExerciseResult
+from ..utils.helpers import SmoothingFilter
 
 
 class BicepCurlTracker(BaseExerciseTracker):
@@ -39,6 +39,12 @@ class BicepCurlTracker(BaseExerciseTracker):
     ELBOW_DRIFT_THRESHOLD = 0.15  # Maximum horizontal drift of elbow (relative to frame width)
     SHOULDER_STABILITY_THRESHOLD = 0.05  # Maximum shoulder movement (relative to frame)
     
+    __slots__ = (
+        'track_side', '_shoulder_key', '_elbow_key', '_wrist_key', '_hip_key',
+        '_required_landmarks', 'angle', 'initial_elbow_x', 'initial_shoulder_y',
+        'elbow_stable', 'body_stable', 'history_size', 'angle_filter'
+    )
+    
     def __init__(self, track_side: str = "left"):
         """
         Initialize the bicep curl tracker.
@@ -49,6 +55,18 @@ class BicepCurlTracker(BaseExerciseTracker):
         super().__init__()
         self.track_side = track_side.lower()
         
+        # Landmark keys for the tracked side
+        self._shoulder_key = f"{self.track_side}_shoulder"
+        self._elbow_key = f"{self.track_side}_elbow"
+        self._wrist_key = f"{self.track_side}_wrist"
+        self._hip_key = f"{self.track_side}_hip"
+        self._required_landmarks = [
+            self._shoulder_key,
+            self._elbow_key,
+            self._wrist_key,
+            self._hip_key
+        ]
+        
         # State tracking
         self.stage = "down"
         self.angle = 0
@@ -60,18 +78,12 @@ class BicepCurlTracker(BaseExerciseTracker):
         self.body_stable = True
         
         # Smoothing
-        self.angle_history: List[float] = []
         self.history_size = 5
+        self.angle_filter = SmoothingFilter(self.history_size)
         
     def get_required_landmarks(self) -> List[str]:
         """Get required landmarks for bicep curl tracking."""
-        side = self.track_side
-        return [
-            f"{side}_shoulder",
-            f"{side}_elbow",
-            f"{side}_wrist",
-            f"{side}_hip"
-        ]
+        return self._required_landmarks
     
     def process(
         self,
@@ -94,7 +106,7 @@ class BicepCurlTracker(BaseExerciseTracker):
         is_valid, missing = self.check_landmarks_visibility(landmarks)
         
         if not is_valid:
-            return ExerciseResult(
+            return self._update_result(
                 rep_count=self.rep_count,
                 stage=self.stage,
                 feedback=f"Can't see: {', '.join(missing)}",
@@ -103,21 +115,19 @@ class BicepCurlTracker(BaseExerciseTracker):
             )
         
         # Get landmark positions
-        side = self.track_side
-        shoulder = landmarks[f"{side}_shoulder"]
-        elbow = landmarks[f"{side}_elbow"]
-        wrist = landmarks[f"{side}_wrist"]
-        hip = landmarks[f"{side}_hip"]
+        shoulder = landmarks[self._shoulder_key]
+        elbow = landmarks[self._elbow_key]
+        wrist = landmarks[self._wrist_key]
+        hip = landmarks[self._hip_key]
         
         # Calculate elbow angle
         self.angle = self._calculate_angle(shoulder, elbow, wrist)
         
         # Smooth the angle
-        self._smooth_angle()
-        smoothed_angle = np.mean(self.angle_history) if self.angle_history else self.angle
+        smoothed_angle = self.angle_filter.add(self.angle)
         
         # Form checks
-        penalties = []
+        penalty = 0.0
         feedback_messages = []
         
         # Check 1: Elbow stability
@@ -125,7 +135,7 @@ class BicepCurlTracker(BaseExerciseTracker):
             elbow, hip, frame_width
         )
         if elbow_penalty > 0:
-            penalties.append(elbow_penalty)
+            penalty += elbow_penalty
             feedback_messages.append(elbow_feedback)
             
         # Check 2: Shoulder/body stability
@@ -133,7 +143,7 @@ class BicepCurlTracker(BaseExerciseTracker):
             shoulder, frame_height
         )
         if shoulder_penalty > 0:
-            penalties.append(shoulder_penalty)
+            penalty += shoulder_penalty
             feedback_messages.append(shoulder_feedback)
             
         # Check 3: Range of motion feedback
@@ -147,7 +157,7 @@ class BicepCurlTracker(BaseExerciseTracker):
             if self.stage == "up":
                 # Completed a rep (was up, now down)
                 self.rep_count += 1
-                if not penalties:
+                if not penalty:
                     feedback_messages = ["Great rep! 💪"]
             self.stage = "down"
             
@@ -158,7 +168,7 @@ class BicepCurlTracker(BaseExerciseTracker):
                 feedback_messages = ["Full range of motion! ✓"]
         
         # Calculate form score
-        self.form_score = self._calculate_form_score(penalties)
+        self.form_score = self._calculate_form_score(penalty)
         
         # Combine feedback
         if feedback_messages:
@@ -168,7 +178,7 @@ class BicepCurlTracker(BaseExerciseTracker):
         else:
             self.feedback = f"Angle: {int(smoothed_angle)}°"
         
-        return ExerciseResult(
+        return self._update_result(
             rep_count=self.rep_count,
             stage=self.stage,
             feedback=self.feedback,
@@ -176,47 +186,11 @@ class BicepCurlTracker(BaseExerciseTracker):
             is_valid_pose=True,
             additional_data={
                 "angle": smoothed_angle,
-                "elbow_stable": len([p for p in penalties if "elbow" in str(p)]) == 0,
-                "body_stable": len([p for p in penalties if "body" in str(p)]) == 0
-            }
+                "elbow_stable": self.elbow_stable,
+                "body_stable": self.body_stable
+            } if self.emit_additional_data else None
         )
     
-    def _calculate_angle(
-        self,
-        point1: Tuple[float, float, float, float],
-        point2: Tuple[float, float, float, float],
-        point3: Tuple[float, float, float, float]
-    ) -> float:
-        """
-        Calculate angle at point2 (elbow) between point1 (shoulder) and point3 (wrist).
-        
-        Args:
-            point1: Shoulder coordinates
-            point2: Elbow coordinates  
-            point3: Wrist coordinates
-            
-        Returns:
-            Angle in degrees
-        """
-        a = np.array([point1[0], point1[1]])
-        b = np.array([point2[0], point2[1]])
-        c = np.array([point3[0], point3[1]])
-        
-        ba = a - b
-        bc = c - b
-        
-        cosine_angle = np.dot(ba, bc) / (np.linalg.norm(ba) * np.linalg.norm(bc) + 1e-6)
-        cosine_angle = np.clip(cosine_angle, -1.0, 1.0)
-        
-        angle = np.degrees(np.arccos(cosine_angle))
-        return angle
-    
-    def _smooth_angle(self):
-        """Add current angle to history for smoothing."""
-        self.angle_history.append(self.angle)
-        if len(self.angle_history) > self.history_size:
-            self.angle_history.pop(0)
-    
     def _check_elbow_stability(
         self,
         elbow: Tuple[float, float, float, float],
@@ -313,7 +287,7 @@ class BicepCurlTracker(BaseExerciseTracker):
         self.initial_shoulder_y = None
         self.elbow_stable = True
         self.body_stable = True
-        self.angle_history.clear()
+        self.angle_filter.reset()
     
     @property
     def exercise_name(self) -> str:
@@ -14,9 +14,9 @@ Rep counting logic:
 """
 
 from typing import Dict, Tuple, List
-import numpy as np
 
 from .base import BaseExerciseTracker, ExerciseResult
+from ..utils.helpers import SmoothingFilter
 
 
 class FrontRaiseTracker(BaseExerciseTracker):
@@ -31,22 +31,33 @@ class FrontRaiseTracker(BaseExerciseTracker):
     DOWN_THRESHOLD = 0.1    # Wrist near hip level
     UP_THRESHOLD = 0.05     # Wrist at shoulder level
     
+    __slots__ = (
+        'track_side', '_shoulder_key', '_elbow_key', '_wrist_key',
+        '_required_landmarks', 'history_size', 'height_filter'
+    )
+    
     def __init__(self, track_side: str = "left"):
         """Initialize the front raise tracker."""
         super().__init__()
         self.track_side = track_side.lower()
+        
+        # Landmark keys for the tracked side
+        self._shoulder_key = f"{self.track_side}_shoulder"
+        self._elbow_key = f"{self.track_side}_elbow"
+        self._wrist_key = f"{self.track_side}_wrist"
+        self._required_landmarks = [
+            self._shoulder_key,
+            self._elbow_key,
+            self._wrist_key
+        ]
+        
         self.stage = "down"
-        self.wrist_height_history: List[float] = []
         self.history_size = 5
+        self.height_filter = SmoothingFilter(self.history_size)
         
     def get_required_landmarks(self) -> List[str]:
         """Get required landmarks."""
-        side = self.track_side
-        return [
-            f"{side}_shoulder",
-            f"{side}_elbow",
-            f"{side}_wrist"
-        ]
+        return self._required_landmarks
     
     def process(
         self,
@@ -58,7 +69,7 @@ class FrontRaiseTracker(BaseExerciseTracker):
         
         is_valid, missing = self.check_landmarks_visibility(landmarks)
         if not is_valid:
-            return ExerciseResult(
+            return self._update_result(
                 rep_count=self.rep_count,
                 stage=self.stage,
                 feedback=f"Can't see: {', '.join(missing)}",
@@ -66,36 +77,32 @@ class FrontRaiseTracker(BaseExerciseTracker):
                 is_valid_pose=False
             )
         
-        side = self.track_side
-        shoulder = landmarks[f"{side}_shoulder"]
-        elbow = landmarks[f"{side}_elbow"]
-        wrist = landmarks[f"{side}_wrist"]
+        shoulder = landmarks[self._shoulder_key]
+        elbow = landmarks[self._elbow_key]
+        wrist = landmarks[self._wrist_key]
         
         # Calculate wrist height relative to shoulder
         # Negative = wrist above shoulder, Positive = wrist below
         wrist_relative_height = wrist[1] - shoulder[1]
         
         # Smooth
-        self.wrist_height_history.append(wrist_relative_height)
-        if len(self.wrist_height_history) > self.history_size:
-            self.wrist_height_history.pop(0)
-        smoothed_height = np.mean(self.wrist_height_history)
+        smoothed_height = self.height_filter.add(wrist_relative_height)
         
         # Calculate elbow angle
         elbow_angle = self._calculate_angle(shoulder, elbow, wrist)
         
         # Form checks
-        penalties = []
+        penalty = 0.0
         feedback_messages = []
         
         # Check elbow is relatively straight
         if elbow_angle < 150:
-            penalties.append(15)
+            penalty += 15
             feedback_messages.append("Keep arms straighter 💪")
         
         # Check wrist doesn't go above shoulder too much
         if smoothed_height < -0.1:
-            penalties.append(10)
+            penalty += 10
             feedback_messages.append("Stop at shoulder level ⏸️")
         
         # Rep counting based on wrist height
@@ -109,13 +116,13 @@ class FrontRaiseTracker(BaseExerciseTracker):
         elif smoothed_height > self.DOWN_THRESHOLD + 0.15:  # Wrist well below shoulder
             if self.stage == "up":
                 self.rep_count += 1
-                if not penalties:
+                if not penalty:
                     feedback_messages = ["Great rep! 💪"]
             self.stage = "down"
         
-        self.form_score = self._calculate_form_score(penalties)
+        self.form_score = self._calculate_form_score(penalty)
         
-        return ExerciseResult(
+        return self._update_result(
             rep_count=self.rep_count,
             stage=self.stage,
             feedback=feedback_messages[0] if feedback_messages else f"Height: {-smoothed_height:.2f}",
@@ -124,27 +131,14 @@ class FrontRaiseTracker(BaseExerciseTracker):
             additional_data={
                 "wrist_height": smoothed_height,
                 "elbow_angle": elbow_angle
-            }
+            } if self.emit_additional_data else None
         )
     
-    def _calculate_angle(self, p1, p2, p3) -> float:
-        """Calculate angle at p2."""
-        a = np.array([p1[0], p1[1]])
-        b = np.array([p2[0], p2[1]])
-        c = np.array([p3[0], p3[1]])
-        
-        ba = a - b
-        bc = c - b
-        
-        cos_angle = np.dot(ba, bc) / (np.linalg.norm(ba) * np.linalg.norm(bc) + 1e-6)
-        cos_angle = np.clip(cos_angle, -1.0, 1.0)
-        return np.degrees(np.arccos(cos_angle))
-    
     def reset(self):
         """Reset tracker."""
         super().reset()
         self.stage = "down"
-        self.wrist_height_history.clear()
+        self.height_filter.reset()
     
     @property
     def exercise_name(self) -> str:
@@ -15,9 +15,10 @@ Rep counting logic:
 """
 
 from typing import Dict, Tuple, List
-import numpy as np
 
 from .base import BaseExerciseTracker, ExerciseResult
+from ..utils.helpers import SmoothingFilter
+from ..utils._kernels import angle_from_vertical
 
 
 class LateralRaiseTracker(BaseExerciseTracker):
@@ -32,6 +33,12 @@ class LateralRaiseTracker(BaseExerciseTracker):
     DOWN_ANGLE_THRESHOLD = 30    # Arms at sides
     UP_ANGLE_THRESHOLD = 70      # Arms raised to ~shoulder level
     
+    __slots__ = (
+        'track_side', '_required_landmarks', '_shoulder_key', '_elbow_key',
+        '_wrist_key', 'angle_left', 'angle_right', 'history_size',
+        'angle_filter'
+    )
+    
     def __init__(self, track_side: str = "both"):
         """
         Initialize the lateral raise tracker.
@@ -41,21 +48,28 @@ class LateralRaiseTracker(BaseExerciseTracker):
         """
         super().__init__()
         self.track_side = track_side.lower()
+        
+        # Landmark keys for the tracked arm(s)
+        if self.track_side == "both":
+            self._required_landmarks = [
+                "left_shoulder", "left_elbow", "left_wrist",
+                "right_shoulder", "right_elbow", "right_wrist"
+            ]
+        else:
+            self._shoulder_key = f"{self.track_side}_shoulder"
+            self._elbow_key = f"{self.track_side}_elbow"
+            self._wrist_key = f"{self.track_side}_wrist"
+            self._required_landmarks = [self._shoulder_key, self._elbow_key, self._wrist_key]
+        
         self.stage = "down"
         self.angle_left = 0
         self.angle_right = 0
-        self.angle_history: List[float] = []
         self.history_size = 5
+        self.angle_filter = SmoothingFilter(self.history_size)
         
     def get_required_landmarks(self) -> List[str]:
         """Get required landmarks."""
-        if self.track_side == "both":
-            return [
-                "left_shoulder", "left_elbow", "left_wrist",
-                "right_shoulder", "right_elbow", "right_wrist"
-            ]
-        side = self.track_side
-        return [f"{side}_shoulder", f"{side}_elbow", f"{side}_wrist"]
+        return self._required_landmarks
     
     def process(
         self,
@@ -67,7 +81,7 @@ class LateralRaiseTracker(BaseExerciseTracker):
         
         is_valid, missing = self.check_landmarks_visibility(landmarks)
         if not is_valid:
-            return ExerciseResult(
+            return self._update_result(
                 rep_count=self.rep_count,
                 stage=self.stage,
                 feedback=f"Can't see: {', '.join(missing)}",
@@ -88,52 +102,47 @@ class LateralRaiseTracker(BaseExerciseTracker):
             # Use average of both arms
             current_angle = (self.angle_left + self.angle_right) / 2
         else:
-            side = self.track_side
             current_angle = self._calculate_arm_angle(
-                landmarks[f"{side}_shoulder"],
-                landmarks[f"{side}_wrist"]
+                landmarks[self._shoulder_key],
+                landmarks[self._wrist_key]
             )
         
         # Smooth the angle
-        self.angle_history.append(current_angle)
-        if len(self.angle_history) > self.history_size:
-            self.angle_history.pop(0)
-        smoothed_angle = np.mean(self.angle_history)
+        smoothed_angle = self.angle_filter.add(current_angle)
         
         # Form checks
-        penalties = []
+        penalty = 0.0
         feedback_messages = []
         
         # Check arm symmetry if tracking both
         if self.track_side == "both":
             angle_diff = abs(self.angle_left - self.angle_right)
             if angle_diff > 20:
-                penalties.append(15)
+                penalty += 15
                 feedback_messages.append("Keep arms even! ⚖️")
         
         # Check if elbows are slightly bent (not locked)
         if self.track_side == "both":
-            left_elbow_angle = self._calculate_elbow_angle(
+            left_elbow_angle = self._calculate_angle(
                 landmarks["left_shoulder"],
                 landmarks["left_elbow"],
                 landmarks["left_wrist"]
             )
-            right_elbow_angle = self._calculate_elbow_angle(
+            right_elbow_angle = self._calculate_angle(
                 landmarks["right_shoulder"],
                 landmarks["right_elbow"],
                 landmarks["right_wrist"]
             )
             avg_elbow = (left_elbow_angle + right_elbow_angle) / 2
         else:
-            side = self.track_side
-            avg_elbow = self._calculate_elbow_angle(
-                landmarks[f"{side}_shoulder"],
-                landmarks[f"{side}_elbow"],
-                landmarks[f"{side}_wrist"]
+            avg_elbow = self._calculate_angle(
+                landmarks[self._shoulder_key],
+                landmarks[self._elbow_key],
+                landmarks[self._wrist_key]
             )
         
         if avg_elbow > 175:
-            penalties.append(10)
+            penalty += 10
             feedback_messages.append("Slight bend in elbows 💪")
         
         # Rep counting
@@ -148,13 +157,13 @@ class LateralRaiseTracker(BaseExerciseTracker):
         elif smoothed_angle < self.DOWN_ANGLE_THRESHOLD:
             if self.stage == "up":
                 self.rep_count += 1
-                if not penalties:
+                if not penalty:
                     feedback_messages = ["Great rep! 💪"]
             self.stage = "down"
         
-        self.form_score = self._calculate_form_score(penalties)
+        self.form_score = self._calculate_form_score(penalty)
         
-        return ExerciseResult(
+        return self._update_result(
             rep_count=self.rep_count,
             stage=self.stage,
             feedback=feedback_messages[0] if feedback_messages else f"Angle: {int(smoothed_angle)}°",
@@ -164,7 +173,7 @@ class LateralRaiseTracker(BaseExerciseTracker):
                 "angle": smoothed_angle,
                 "angle_left": self.angle_left,
                 "angle_right": self.angle_right
-            }
+            } if self.emit_additional_data else None
         )
     
     def _calculate_arm_angle(
@@ -173,29 +182,7 @@ class LateralRaiseTracker(BaseExerciseTracker):
         wrist: Tuple[float, float, float, float]
     ) -> float:
         """Calculate arm angle from vertical (0 = arm at side)."""
-        # Vector from shoulder to wrist
-        arm_vector = np.array([wrist[0] - shoulder[0], wrist[1] - shoulder[1]])
-        # Vertical vector (pointing down)
-        vertical = np.array([0, 1])
-        
-        cos_angle = np.dot(arm_vector, vertical) / (np.linalg.norm(arm_vector) * np.linalg.norm(vertical) + 1e-6)
-        cos_angle = np.clip(cos_angle, -1.0, 1.0)
-        angle = np.degrees(np.arccos(cos_angle))
-        
-        return angle
-    
-    def _calculate_elbow_angle(self, p1, p2, p3) -> float:
-        """Calculate angle at elbow."""
-        a = np.array([p1[0], p1[1]])
-        b = np.array([p2[0], p2[1]])
-        c = np.array([p3[0], p3[1]])
-        
-        ba = a - b
-        bc = c - b
-        
-        cos_angle = np.dot(ba, bc) / (np.linalg.norm(ba) * np.linalg.norm(bc) + 1e-6)
-        cos_angle = np.clip(cos_angle, -1.0, 1.0)
-        return np.degrees(np.arccos(cos_angle))
+        return angle_from_vertical(shoulder[0], shoulder[1], wrist[0], wrist[1])
     
     def reset(self):
         """Reset tracker."""
@@ -203,7 +190,7 @@ class LateralRaiseTracker(BaseExerciseTracker):
         self.stage = "down"
         self.angle_left = 0
         self.angle_right = 0
-        self.angle_history.clear()
+        self.angle_filter.reset()
     
     @property
     def exercise_name(self) -> str:
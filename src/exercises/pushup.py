@@ -19,9 +19,9 @@ Best tracked from SIDE VIEW for accurate angle detection.
 """
 
 from typing import Dict, Tuple, List
-import numpy as np
 
 from .base import BaseExerciseTracker, ExerciseResult
+from ..utils.helpers import SmoothingFilter
 
 
 class PushUpTracker(BaseExerciseTracker):
@@ -42,6 +42,12 @@ class PushUpTracker(BaseExerciseTracker):
     BODY_ALIGNMENT_THRESHOLD = 20  # Maximum deviation from straight line (degrees)
     ELBOW_FLARE_THRESHOLD = 0.15   # Maximum elbow distance from shoulder (normalized)
     
+    __slots__ = (
+        'track_side', '_shoulder_key', '_elbow_key', '_wrist_key', '_hip_key',
+        '_ankle_key', '_required_landmarks', 'elbow_angle', 'lowest_angle',
+        'reached_depth', 'history_size', 'angle_filter', 'body_alignment_score'
+    )
+    
     def __init__(self, track_side: str = "left"):
         """
         Initialize the push-up tracker.
@@ -52,6 +58,20 @@ class PushUpTracker(BaseExerciseTracker):
         super().__init__()
         self.track_side = track_side.lower()
         
+        # Landmark keys for the tracked side
+        self._shoulder_key = f"{self.track_side}_shoulder"
+        self._elbow_key = f"{self.track_side}_elbow"
+        self._wrist_key = f"{self.track_side}_wrist"
+        self._hip_key = f"{self.track_side}_hip"
+        self._ankle_key = f"{self.track_side}_ankle"
+        self._required_landmarks = [
+            self._shoulder_key,
+            self._elbow_key,
+            self._wrist_key,
+            self._hip_key,
+            self._ankle_key
+        ]
+        
         # State tracking
         self.stage = "up"
         self.elbow_angle = 0
@@ -61,22 +81,15 @@ class PushUpTracker(BaseExerciseTracker):
         self.reached_depth = False
         
         # Smoothing
-        self.angle_history: List[float] = []
         self.history_size = 5
+        self.angle_filter = SmoothingFilter(self.history_size)
         
         # Form tracking
         self.body_alignment_score = 100
         
     def get_required_landmarks(self) -> List[str]:
         """Get required landmarks for push-up tracking."""
-        side = self.track_side
-        return [
-            f"{side}_shoulder",
-            f"{side}_elbow",
-            f"{side}_wrist",
-            f"{side}_hip",
-            f"{side}_ankle"
-        ]
+        return self._required_landmarks
     
     def process(
         self,
@@ -99,7 +112,7 @@ class PushUpTracker(BaseExerciseTracker):
         is_valid, missing = self.check_landmarks_visibility(landmarks)
         
         if not is_valid:
-            return ExerciseResult(
+            return self._update_result(
                 rep_count=self.rep_count,
                 stage=self.stage,
                 feedback=f"Can't see: {', '.join(missing)}. Use side view!",
@@ -108,60 +121,51 @@ class PushUpTracker(BaseExerciseTracker):
             )
         
         # Get landmark positions
-        side = self.track_side
-        shoulder = landmarks[f"{side}_shoulder"]
-        elbow = landmarks[f"{side}_elbow"]
-        wrist = landmarks[f"{side}_wrist"]
-        hip = landmarks[f"{side}_hip"]
-        ankle = landmarks[f"{side}_ankle"]
+        shoulder = landmarks[self._shoulder_key]
+        elbow = landmarks[self._elbow_key]
+        wrist = landmarks[self._wrist_key]
+        hip = landmarks[self._hip_key]
+        ankle = landmarks[self._ankle_key]
         
         # Calculate elbow angle
         self.elbow_angle = self._calculate_angle(shoulder, elbow, wrist)
         
         # Smooth the angle
-        self._smooth_angle()
-        smoothed_angle = np.mean(self.angle_history) if self.angle_history else self.elbow_angle
+        smoothed_angle = self.angle_filter.add(self.elbow_angle)
         
         # Track lowest point
         if smoothed_angle < self.lowest_angle:
             self.lowest_angle = smoothed_angle
         
-        # Form checks
-        penalties = []
-        feedback_messages = []
+        # Form checks (the first failing check supplies the feedback)
+        penalty = 0.0
+        message = ""
         
         # Check 1: Body alignment (straight line)
         alignment_penalty, alignment_feedback = self._check_body_alignment(
             shoulder, hip, ankle
         )
         if alignment_penalty > 0:
-            penalties.append(alignment_penalty)
-            feedback_messages.append(alignment_feedback)
+            penalty += alignment_penalty
+            message = alignment_feedback
             
         # Check 2: Elbow flare
-        flare_penalty, flare_feedback = self._check_elbow_flare(
-            shoulder, elbow, frame_width
-        )
+        flare_penalty, flare_feedback = self._check_elbow_flare(shoulder, elbow)
         if flare_penalty > 0:
-            penalties.append(flare_penalty)
-            feedback_messages.append(flare_feedback)
-            
-        # Check 3: Depth feedback
-        depth_feedback = self._check_depth(smoothed_angle)
+            penalty += flare_penalty
+            message = message or flare_feedback
         
         # Update rep counting
-        prev_stage = self.stage
-        
         if smoothed_angle > self.UP_ANGLE_THRESHOLD:
             # Arms extended (up position)
             if self.stage == "down":
                 # Completed a rep (was down, now up)
                 self.rep_count += 1
                 if self.reached_depth:
-                    if not penalties:
-                        feedback_messages = ["Great push-up! 💪"]
+                    if not penalty:
+                        message = "Great push-up! 💪"
                 else:
-                    feedback_messages.insert(0, "Go lower next time! ⬇️")
+                    message = "Go lower next time! ⬇️"
                 # Reset for next rep
                 self.lowest_angle = 180
                 self.reached_depth = False
@@ -171,26 +175,23 @@ class PushUpTracker(BaseExerciseTracker):
             # Chest near ground (down position)
             self.stage = "down"
             self.reached_depth = True
-            if not feedback_messages:
-                feedback_messages = ["Good depth! ✓"]
+            message = message or "Good depth! ✓"
         else:
             # In between - transitioning
             if self.stage == "up" and smoothed_angle < 140:
-                if not feedback_messages:
-                    feedback_messages = ["Keep going down... ⬇️"]
+                message = message or "Keep going down... ⬇️"
         
         # Calculate form score
-        self.form_score = self._calculate_form_score(penalties)
+        self.form_score = self._calculate_form_score(penalty)
         
-        # Combine feedback
-        if feedback_messages:
-            self.feedback = feedback_messages[0]
-        elif depth_feedback:
-            self.feedback = depth_feedback
-        else:
-            self.feedback = f"Angle: {int(smoothed_angle)}°"
+        # Check 3: Depth feedback, only needed when nothing else applies
+        self.feedback = (
+            message
+            or self._check_depth(smoothed_angle)
+            or f"Angle: {int(smoothed_angle)}°"
+        )
         
-        return ExerciseResult(
+        return self._update_result(
             rep_count=self.rep_count,
             stage=self.stage,
             feedback=self.feedback,
@@ -201,45 +202,9 @@ class PushUpTracker(BaseExerciseTracker):
                 "lowest_angle": self.lowest_angle,
                 "reached_depth": self.reached_depth,
                 "body_alignment_score": self.body_alignment_score
-            }
+            } if self.emit_additional_data else None
         )
     
-    def _calculate_angle(
-        self,
-        point1: Tuple[float, float, float, float],
-        point2: Tuple[float, float, float, float],
-        point3: Tuple[float, float, float, float]
-    ) -> float:
-        """
-        Calculate angle at point2 between point1 and point3.
-        
-        Args:
-            point1: Shoulder coordinates
-            point2: Elbow coordinates
-            point3: Wrist coordinates
-            
-        Returns:
-            Angle in degrees
-        """
-        a = np.array([point1[0], point1[1]])
-        b = np.array([point2[0], point2[1]])
-        c = np.array([point3[0], point3[1]])
-        
-        ba = a - b
-        bc = c - b
-        
-        cosine_angle = np.dot(ba, bc) / (np.linalg.norm(ba) * np.linalg.norm(bc) + 1e-6)
-        cosine_angle = np.clip(cosine_angle, -1.0, 1.0)
-        
-        angle = np.degrees(np.arccos(cosine_angle))
-        return angle
-    
-    def _smooth_angle(self):
-        """Add current angle to history for smoothing."""
-        self.angle_history.append(self.elbow_angle)
-        if len(self.angle_history) > self.history_size:
-            self.angle_history.pop(0)
-    
     def _check_body_alignment(
         self,
         shoulder: Tuple[float, float, float, float],
@@ -290,8 +255,7 @@ class PushUpTracker(BaseExerciseTracker):
     def _check_elbow_flare(
         self,
         shoulder: Tuple[float, float, float, float],
-        elbow: Tuple[float, float, float, float],
-        frame_width: int
+        elbow: Tuple[float, float, float, float]
     ) -> Tuple[float, str]:
         """
         Check if elbows are flaring out too much.
@@ -300,8 +264,7 @@ class PushUpTracker(BaseExerciseTracker):
         
         Args:
             shoulder: Shoulder landmark
-            elbow: Elbow landmark
-            frame_width: Frame width for normalization
+            elbow: Elbow landmark (normalized coordinates)
             
         Returns:
             Tuple of (penalty, feedback_message)
@@ -355,8 +318,8 @@ class PushUpTracker(BaseExerciseTracker):
         """
         # Check if body is roughly horizontal
         # All y-coordinates should be similar
-        y_values = [shoulder[1], hip[1], ankle[1]]
-        y_range = max(y_values) - min(y_values)
+        shoulder_y, hip_y, ankle_y = shoulder[1], hip[1], ankle[1]
+        y_range = max(shoulder_y, hip_y, ankle_y) - min(shoulder_y, hip_y, ankle_y)
         
         # If y-range is small, body is horizontal
         return y_range < 0.3
@@ -369,7 +332,7 @@ class PushUpTracker(BaseExerciseTracker):
         self.lowest_angle = 180
         self.reached_depth = False
         self.body_alignment_score = 100
-        self.angle_history.clear()
+        self.angle_filter.reset()
     
     @property
     def exercise_name(self) -> str:
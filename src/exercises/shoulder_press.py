@@ -14,9 +14,9 @@ Rep counting logic:
 """
 
 from typing import Dict, Tuple, List
-import numpy as np
 
 from .base import BaseExerciseTracker, ExerciseResult
+from ..utils.helpers import SmoothingFilter
 
 
 class ShoulderPressTracker(BaseExerciseTracker):
@@ -31,23 +31,34 @@ class ShoulderPressTracker(BaseExerciseTracker):
     DOWN_ANGLE_THRESHOLD = 100   # Arms at shoulder level
     UP_ANGLE_THRESHOLD = 160     # Arms extended overhead
     
+    __slots__ = (
+        'track_side', '_shoulder_key', '_elbow_key', '_wrist_key',
+        '_required_landmarks', 'angle', 'history_size', 'angle_filter'
+    )
+    
     def __init__(self, track_side: str = "left"):
         """Initialize the shoulder press tracker."""
         super().__init__()
         self.track_side = track_side.lower()
+        
+        # Landmark keys for the tracked side
+        self._shoulder_key = f"{self.track_side}_shoulder"
+        self._elbow_key = f"{self.track_side}_elbow"
+        self._wrist_key = f"{self.track_side}_wrist"
+        self._required_landmarks = [
+            self._shoulder_key,
+            self._elbow_key,
+            self._wrist_key
+        ]
+        
         self.stage = "down"
         self.angle = 0
-        self.angle_history: List[float] = []
         self.history_size = 5
+        self.angle_filter = SmoothingFilter(self.history_size)
         
     def get_required_landmarks(self) -> List[str]:
         """Get required landmarks - only upper body needed."""
-        side = self.track_side
-        return [
-            f"{side}_shoulder",
-            f"{side}_elbow",
-            f"{side}_wrist"
-        ]
+        return self._required_landmarks
     
     def process(
         self,
@@ -59,7 +70,7 @@ class ShoulderPressTracker(BaseExerciseTracker):
         
         is_valid, missing = self.check_landmarks_visibility(landmarks)
         if not is_valid:
-            return ExerciseResult(
+            return self._update_result(
                 rep_count=self.rep_count,
                 stage=self.stage,
                 feedback=f"Can't see: {', '.join(missing)}",
@@ -67,39 +78,37 @@ class ShoulderPressTracker(BaseExerciseTracker):
                 is_valid_pose=False
             )
         
-        side = self.track_side
-        shoulder = landmarks[f"{side}_shoulder"]
-        elbow = landmarks[f"{side}_elbow"]
-        wrist = landmarks[f"{side}_wrist"]
+        shoulder = landmarks[self._shoulder_key]
+        elbow = landmarks[self._elbow_key]
+        wrist = landmarks[self._wrist_key]
         
         # Calculate elbow angle
         self.angle = self._calculate_angle(shoulder, elbow, wrist)
         
         # Smooth the angle
-        self._smooth_angle()
-        smoothed_angle = np.mean(self.angle_history) if self.angle_history else self.angle
+        smoothed_angle = self.angle_filter.add(self.angle)
         
         # Form checks
-        penalties = []
+        penalty = 0.0
         feedback_messages = []
         
         # Check if wrist is above shoulder (proper overhead position)
         if self.stage == "up" or smoothed_angle > 140:
             if wrist[1] > shoulder[1]:  # wrist below shoulder (y increases downward)
-                penalties.append(20)
+                penalty += 20
                 feedback_messages.append("Push higher! Arms overhead ⬆️")
         
         # Check elbow position - shouldn't flare too wide
         elbow_shoulder_dist = abs(elbow[0] - shoulder[0])
         if elbow_shoulder_dist > 0.2:
-            penalties.append(15)
+            penalty += 15
             feedback_messages.append("Keep elbows in front 💪")
         
         # Rep counting
         if smoothed_angle > self.UP_ANGLE_THRESHOLD:
             if self.stage == "down":
                 self.rep_count += 1
-                if not penalties:
+                if not penalty:
                     feedback_messages = ["Great press! 💪"]
             self.stage = "up"
             if not feedback_messages:
@@ -110,42 +119,23 @@ class ShoulderPressTracker(BaseExerciseTracker):
             if not feedback_messages:
                 feedback_messages = ["Ready to press ⬆️"]
         
-        self.form_score = self._calculate_form_score(penalties)
+        self.form_score = self._calculate_form_score(penalty)
         
-        return ExerciseResult(
+        return self._update_result(
             rep_count=self.rep_count,
             stage=self.stage,
             feedback=feedback_messages[0] if feedback_messages else f"Angle: {int(smoothed_angle)}°",
             form_score=self.form_score,
             is_valid_pose=True,
-            additional_data={"angle": smoothed_angle}
+            additional_data={"angle": smoothed_angle} if self.emit_additional_data else None
         )
     
-    def _calculate_angle(self, p1, p2, p3) -> float:
-        """Calculate angle at p2."""
-        a = np.array([p1[0], p1[1]])
-        b = np.array([p2[0], p2[1]])
-        c = np.array([p3[0], p3[1]])
-        
-        ba = a - b
-        bc = c - b
-        
-        cos_angle = np.dot(ba, bc) / (np.linalg.norm(ba) * np.linalg.norm(bc) + 1e-6)
-        cos_angle = np.clip(cos_angle, -1.0, 1.0)
-        return np.degrees(np.arccos(cos_angle))
-    
-    def _smooth_angle(self):
-        """Smooth angle values."""
-        self.angle_history.append(self.angle)
-        if len(self.angle_history) > self.history_size:
-            self.angle_history.pop(0)
-    
     def reset(self):
         """Reset tracker."""
         super().reset()
         self.stage = "down"
         self.angle = 0
-        self.angle_history.clear()
+        self.angle_filter.reset()
     
     @property
     def exercise_name(self) -> str:
@@ -13,9 +13,9 @@ Rep counting logic:
 """
 
 from typing import Dict, Tuple, List
-import numpy as np
 
 from .base import BaseExerciseTracker, ExerciseResult
+from ..utils.helpers import SmoothingFilter
 
 
 class ShoulderShrugTracker(BaseExerciseTracker):
@@ -30,22 +30,28 @@ class ShoulderShrugTracker(BaseExerciseTracker):
     RELAXED_THRESHOLD = 0.12    # Shoulders relaxed
     SHRUGGED_THRESHOLD = 0.06   # Shoulders raised
     
+    REQUIRED_LANDMARKS = [
+        "left_shoulder",
+        "right_shoulder",
+        "left_ear",
+        "right_ear"
+    ]
+    
+    __slots__ = (
+        'history_size', 'distance_filter', 'baseline_distance'
+    )
+    
     def __init__(self):
         """Initialize the shoulder shrug tracker."""
         super().__init__()
         self.stage = "down"
-        self.distance_history: List[float] = []
         self.history_size = 5
+        self.distance_filter = SmoothingFilter(self.history_size)
         self.baseline_distance = None
         
     def get_required_landmarks(self) -> List[str]:
         """Get required landmarks - minimal upper body."""
-        return [
-            "left_shoulder",
-            "right_shoulder",
-            "left_ear",
-            "right_ear"
-        ]
+        return self.REQUIRED_LANDMARKS
     
     def process(
         self,
@@ -57,7 +63,7 @@ class ShoulderShrugTracker(BaseExerciseTracker):
         
         is_valid, missing = self.check_landmarks_visibility(landmarks)
         if not is_valid:
-            return ExerciseResult(
+            return self._update_result(
                 rep_count=self.rep_count,
                 stage=self.stage,
                 feedback=f"Can't see: {', '.join(missing)}",
@@ -84,19 +90,16 @@ class ShoulderShrugTracker(BaseExerciseTracker):
             self.baseline_distance = shoulder_ear_distance
         
         # Smooth
-        self.distance_history.append(shoulder_ear_distance)
-        if len(self.distance_history) > self.history_size:
-            self.distance_history.pop(0)
-        smoothed_distance = np.mean(self.distance_history)
+        smoothed_distance = self.distance_filter.add(shoulder_ear_distance)
         
         # Form checks
-        penalties = []
+        penalty = 0.0
         feedback_messages = []
         
         # Check shoulder symmetry
         shoulder_diff = abs(left_shoulder[1] - right_shoulder[1])
         if shoulder_diff > 0.03:
-            penalties.append(15)
+            penalty += 15
             feedback_messages.append("Keep shoulders even! ⚖️")
         
         # Rep counting
@@ -110,26 +113,26 @@ class ShoulderShrugTracker(BaseExerciseTracker):
         elif smoothed_distance > self.RELAXED_THRESHOLD:
             if self.stage == "up":
                 self.rep_count += 1
-                if not penalties:
+                if not penalty:
                     feedback_messages = ["Great shrug! 💪"]
             self.stage = "down"
         
-        self.form_score = self._calculate_form_score(penalties)
+        self.form_score = self._calculate_form_score(penalty)
         
-        return ExerciseResult(
+        return self._update_result(
             rep_count=self.rep_count,
             stage=self.stage,
             feedback=feedback_messages[0] if feedback_messages else "Shrug shoulders up ⬆️",
             form_score=self.form_score,
             is_valid_pose=True,
-            additional_data={"shoulder_ear_distance": smoothed_distance}
+            additional_data={"shoulder_ear_distance": smoothed_distance} if self.emit_additional_data else None
         )
     
     def reset(self):
         """Reset tracker."""
         super().reset()
         self.stage = "down"
-        self.distance_history.clear()
+        self.distance_filter.reset()
         self.baseline_distance = None
     
     @property
@@ -16,9 +16,10 @@ Rep counting logic:
 """
 
 from typing import Dict, Tuple, List
-import numpy as np
 
 from .base import BaseExerciseTracker, ExerciseResult
+from ..utils.helpers import SmoothingFilter
+from ..utils._kernels import angle_from_vertical
 
 
 class SquatTracker(BaseExerciseTracker):
@@ -39,6 +40,12 @@ class SquatTracker(BaseExerciseTracker):
     KNEE_OVER_TOE_THRESHOLD = 0.05  # How far knee can go past ankle (normalized)
     MIN_BACK_ANGLE = 45             # Minimum acceptable back angle from vertical
     
+    __slots__ = (
+        'track_side', '_shoulder_key', '_hip_key', '_knee_key', '_ankle_key',
+        '_required_landmarks', '_forward_sign', 'knee_angle', 'hip_angle',
+        'deepest_angle', 'reached_depth', 'history_size', 'angle_filter'
+    )
+    
     def __init__(self, track_side: str = "left"):
         """
         Initialize the squat tracker.
@@ -49,6 +56,21 @@ class SquatTracker(BaseExerciseTracker):
         super().__init__()
         self.track_side = track_side.lower()
         
+        # Landmark keys for the tracked side
+        self._shoulder_key = f"{self.track_side}_shoulder"
+        self._hip_key = f"{self.track_side}_hip"
+        self._knee_key = f"{self.track_side}_knee"
+        self._ankle_key = f"{self.track_side}_ankle"
+        self._required_landmarks = [
+            self._shoulder_key,
+            self._hip_key,
+            self._knee_key,
+            self._ankle_key
+        ]
+        
+        # Facing direction in a side view: +1 when "forward" is toward -x
+        self._forward_sign = 1.0 if self.track_side == "left" else -1.0
+        
         # State tracking
         self.stage = "standing"
         self.knee_angle = 0
@@ -59,18 +81,12 @@ class SquatTracker(BaseExerciseTracker):
         self.reached_depth = False
         
         # Smoothing
-        self.angle_history: List[float] = []
         self.history_size = 5
+        self.angle_filter = SmoothingFilter(self.history_size)
         
     def get_required_landmarks(self) -> List[str]:
         """Get required landmarks for squat tracking."""
-        side = self.track_side
-        return [
-            f"{side}_shoulder",
-            f"{side}_hip",
-            f"{side}_knee",
-            f"{side}_ankle"
-        ]
+        return self._required_landmarks
     
     def process(
         self,
@@ -93,7 +109,7 @@ class SquatTracker(BaseExerciseTracker):
         is_valid, missing = self.check_landmarks_visibility(landmarks)
         
         if not is_valid:
-            return ExerciseResult(
+            return self._update_result(
                 rep_count=self.rep_count,
                 stage=self.stage,
                 feedback=f"Can't see: {', '.join(missing)}",
@@ -102,56 +118,52 @@ class SquatTracker(BaseExerciseTracker):
             )
         
         # Get landmark positions
-        side = self.track_side
-        shoulder = landmarks[f"{side}_shoulder"]
-        hip = landmarks[f"{side}_hip"]
-        knee = landmarks[f"{side}_knee"]
-        ankle = landmarks[f"{side}_ankle"]
+        shoulder = landmarks[self._shoulder_key]
+        hip = landmarks[self._hip_key]
+        knee = landmarks[self._knee_key]
+        ankle = landmarks[self._ankle_key]
         
         # Calculate angles
         self.knee_angle = self._calculate_angle(hip, knee, ankle)
         self.hip_angle = self._calculate_angle(shoulder, hip, knee)
         
         # Smooth the knee angle
-        self._smooth_angle()
-        smoothed_knee_angle = np.mean(self.angle_history) if self.angle_history else self.knee_angle
+        smoothed_knee_angle = self.angle_filter.add(self.knee_angle)
         
         # Track deepest point
         if smoothed_knee_angle < self.deepest_angle:
             self.deepest_angle = smoothed_knee_angle
             
-        # Form checks
-        penalties = []
-        feedback_messages = []
+        # Form checks (the first failing check supplies the feedback)
+        penalty = 0.0
+        message = ""
         
         # Check 1: Knees over toes
         knee_penalty, knee_feedback = self._check_knee_position(knee, ankle)
         if knee_penalty > 0:
-            penalties.append(knee_penalty)
-            feedback_messages.append(knee_feedback)
+            penalty += knee_penalty
+            message = knee_feedback
             
         # Check 2: Back angle
         back_penalty, back_feedback = self._check_back_angle(shoulder, hip, knee)
         if back_penalty > 0:
-            penalties.append(back_penalty)
-            feedback_messages.append(back_feedback)
+            penalty += back_penalty
+            message = message or back_feedback
             
         # Check 3: Depth feedback
         depth_feedback = self._check_depth(smoothed_knee_angle)
         
         # Update rep counting
-        prev_stage = self.stage
-        
         if smoothed_knee_angle > self.STANDING_KNEE_THRESHOLD:
             # Standing position
             if self.stage == "squat":
                 # Completed a rep (was squat, now standing)
                 self.rep_count += 1
                 if self.reached_depth:
-                    if not penalties:
-                        feedback_messages = ["Great squat! 💪"]
+                    if not penalty:
+                        message = "Great squat! 💪"
                 else:
-                    feedback_messages.insert(0, "Go deeper next time! ⬇️")
+                    message = "Go deeper next time! ⬇️"
                 # Reset for next rep
                 self.deepest_angle = 180
                 self.reached_depth = False
@@ -161,27 +173,25 @@ class SquatTracker(BaseExerciseTracker):
             # Squat position
             self.stage = "squat"
             self.reached_depth = True
-            if not feedback_messages:
-                feedback_messages = ["Great depth! ✓"]
+            message = message or "Great depth! ✓"
         else:
             # In between - transitioning
             if self.stage == "standing":
                 # Going down
-                if not feedback_messages and not depth_feedback:
-                    feedback_messages = ["Keep going down... ⬇️"]
+                if not message and not depth_feedback:
+                    message = "Keep going down... ⬇️"
         
         # Calculate form score
-        self.form_score = self._calculate_form_score(penalties)
+        self.form_score = self._calculate_form_score(penalty)
         
         # Combine feedback
-        if feedback_messages:
-            self.feedback = feedback_messages[0]
-        elif depth_feedback:
-            self.feedback = depth_feedback
-        else:
-            self.feedback = f"Knee: {int(smoothed_knee_angle)}°"
+        self.feedback = (
+            message
+            or depth_feedback
+            or f"Knee: {int(smoothed_knee_angle)}°"
+        )
         
-        return ExerciseResult(
+        return self._update_result(
             rep_count=self.rep_count,
             stage=self.stage,
             feedback=self.feedback,
@@ -192,45 +202,9 @@ class SquatTracker(BaseExerciseTracker):
                 "hip_angle": self.hip_angle,
                 "deepest_angle": self.deepest_angle,
                 "reached_depth": self.reached_depth
-            }
+            } if self.emit_additional_data else None
         )
     
-    def _calculate_angle(
-        self,
-        point1: Tuple[float, float, float, float],
-        point2: Tuple[float, float, float, float],
-        point3: Tuple[float, float, float, float]
-    ) -> float:
-        """
-        Calculate angle at point2 between point1 and point3.
-        
-        Args:
-            point1: First point
-            point2: Vertex point
-            point3: Third point
-            
-        Returns:
-            Angle in degrees
-        """
-        a = np.array([point1[0], point1[1]])
-        b = np.array([point2[0], point2[1]])
-        c = np.array([point3[0], point3[1]])
-        
-        ba = a - b
-        bc = c - b
-        
-        cosine_angle = np.dot(ba, bc) / (np.linalg.norm(ba) * np.linalg.norm(bc) + 1e-6)
-        cosine_angle = np.clip(cosine_angle, -1.0, 1.0)
-        
-        angle = np.degrees(np.arccos(cosine_angle))
-        return angle
-    
-    def _smooth_angle(self):
-        """Add current knee angle to history for smoothing."""
-        self.angle_history.append(self.knee_angle)
-        if len(self.angle_history) > self.history_size:
-            self.angle_history.pop(0)
-    
     def _check_knee_position(
         self,
         knee: Tuple[float, float, float, float],
@@ -247,17 +221,10 @@ class SquatTracker(BaseExerciseTracker):
             Tuple of (penalty, feedback_message)
         """
         # Compare x positions (horizontal)
-        # In a side view, if knee x is significantly past ankle x, it's over toes
-        knee_x = knee[0]
-        ankle_x = ankle[0]
-        
-        # Determine which direction is "forward" based on which side we're tracking
-        if self.track_side == "left":
-            # Left side view: knee going left of ankle is forward
-            overshoot = ankle_x - knee_x
-        else:
-            # Right side view: knee going right of ankle is forward
-            overshoot = knee_x - ankle_x
+        # In a side view, if knee x is significantly past ankle x, it's over toes.
+        # Left side view: knee going left of ankle is forward;
+        # right side view: knee going right of ankle is forward
+        overshoot = self._forward_sign * (ankle[0] - knee[0])
         
         if overshoot > self.KNEE_OVER_TOE_THRESHOLD:
             penalty = min(35, overshoot * 300)
@@ -282,21 +249,12 @@ class SquatTracker(BaseExerciseTracker):
         Returns:
             Tuple of (penalty, feedback_message)
         """
-        # Calculate torso angle from vertical
-        # Vertical line is straight up (0, -1)
-        shoulder_pos = np.array([shoulder[0], shoulder[1]])
-        hip_pos = np.array([hip[0], hip[1]])
-        
-        torso_vector = shoulder_pos - hip_pos
-        vertical = np.array([0, -1])  # Up direction
-        
-        # Calculate angle from vertical
-        cos_angle = np.dot(torso_vector, vertical) / (np.linalg.norm(torso_vector) * np.linalg.norm(vertical) + 1e-6)
-        cos_angle = np.clip(cos_angle, -1.0, 1.0)
-        back_angle = np.degrees(np.arccos(cos_angle))
-        
         # Only check when in squat position
         if self.stage == "squat" or self.knee_angle < 120:
+            # Calculate torso angle from vertical: the hip should sit straight
+            # below the shoulder when the back is upright
+            back_angle = angle_from_vertical(shoulder[0], shoulder[1], hip[0], hip[1])
+            
             if back_angle > self.MIN_BACK_ANGLE:
                 penalty = min(30, (back_angle - self.MIN_BACK_ANGLE) * 1.5)
                 return penalty, "Keep your back straight! 🔙"
@@ -330,7 +288,7 @@ class SquatTracker(BaseExerciseTracker):
         self.hip_angle = 0
         self.deepest_angle = 180
         self.reached_depth = False
-        self.angle_history.clear()
+        self.angle_filter.reset()
     
     @property
     def exercise_name(self) -> str:
@@ -14,9 +14,9 @@ Rep counting logic:
 """
 
 from typing import Dict, Tuple, List
-import numpy as np
 
 from .base import BaseExerciseTracker, ExerciseResult
+from ..utils.helpers import SmoothingFilter
 
 
 class TricepExtensionTracker(BaseExerciseTracker):
@@ -31,24 +31,36 @@ class TricepExtensionTracker(BaseExerciseTracker):
     DOWN_ANGLE_THRESHOLD = 60    # Elbow fully bent
     UP_ANGLE_THRESHOLD = 150     # Arm extended
     
+    __slots__ = (
+        'track_side', '_shoulder_key', '_elbow_key', '_wrist_key',
+        '_required_landmarks', 'angle', 'history_size', 'angle_filter',
+        'initial_elbow_pos'
+    )
+    
     def __init__(self, track_side: str = "left"):
         """Initialize the tricep extension tracker."""
         super().__init__()
         self.track_side = track_side.lower()
+        
+        # Landmark keys for the tracked side
+        self._shoulder_key = f"{self.track_side}_shoulder"
+        self._elbow_key = f"{self.track_side}_elbow"
+        self._wrist_key = f"{self.track_side}_wrist"
+        self._required_landmarks = [
+            self._shoulder_key,
+            self._elbow_key,
+            self._wrist_key
+        ]
+        
         self.stage = "down"
         self.angle = 0
-        self.angle_history: List[float] = []
         self.history_size = 5
+        self.angle_filter = SmoothingFilter(self.history_size)
         self.initial_elbow_pos = None
         
     def get_required_landmarks(self) -> List[str]:
         """Get required landmarks."""
-        side = self.track_side
-        return [
-            f"{side}_shoulder",
-            f"{side}_elbow",
-            f"{side}_wrist"
-        ]
+        return self._required_landmarks
     
     def process(
         self,
@@ -60,7 +72,7 @@ class TricepExtensionTracker(BaseExerciseTracker):
         
         is_valid, missing = self.check_landmarks_visibility(landmarks)
         if not is_valid:
-            return ExerciseResult(
+            return self._update_result(
                 rep_count=self.rep_count,
                 stage=self.stage,
                 feedback=f"Can't see: {', '.join(missing)}",
@@ -68,14 +80,13 @@ class TricepExtensionTracker(BaseExerciseTracker):
                 is_valid_pose=False
             )
         
-        side = self.track_side
-        shoulder = landmarks[f"{side}_shoulder"]
-        elbow = landmarks[f"{side}_elbow"]
-        wrist = landmarks[f"{side}_wrist"]
+        shoulder = landmarks[self._shoulder_key]
+        elbow = landmarks[self._elbow_key]
+        wrist = landmarks[self._wrist_key]
         
         # Check if elbow is above shoulder (overhead position)
         if elbow[1] > shoulder[1] + 0.1:  # Elbow below shoulder
-            return ExerciseResult(
+            return self._update_result(
                 rep_count=self.rep_count,
                 stage=self.stage,
                 feedback="Raise elbow overhead! ⬆️",
@@ -87,23 +98,20 @@ class TricepExtensionTracker(BaseExerciseTracker):
         self.angle = self._calculate_angle(shoulder, elbow, wrist)
         
         # Smooth
-        self.angle_history.append(self.angle)
-        if len(self.angle_history) > self.history_size:
-            self.angle_history.pop(0)
-        smoothed_angle = np.mean(self.angle_history)
+        smoothed_angle = self.angle_filter.add(self.angle)
         
         # Set initial elbow position
         if self.initial_elbow_pos is None:
             self.initial_elbow_pos = (elbow[0], elbow[1])
         
         # Form checks
-        penalties = []
+        penalty = 0.0
         feedback_messages = []
         
         # Check elbow stays relatively stationary
         elbow_drift = abs(elbow[0] - self.initial_elbow_pos[0])
         if elbow_drift > 0.08:
-            penalties.append(20)
+            penalty += 20
             feedback_messages.append("Keep elbow still! 📍")
             # Update reference slowly
             self.initial_elbow_pos = (
@@ -115,7 +123,7 @@ class TricepExtensionTracker(BaseExerciseTracker):
         if smoothed_angle > self.UP_ANGLE_THRESHOLD:
             if self.stage == "down":
                 self.rep_count += 1
-                if not penalties:
+                if not penalty:
                     feedback_messages = ["Great extension! 💪"]
             self.stage = "up"
             if not feedback_messages:
@@ -126,36 +134,23 @@ class TricepExtensionTracker(BaseExerciseTracker):
             if not feedback_messages:
                 feedback_messages = ["Good stretch 👍"]
         
-        self.form_score = self._calculate_form_score(penalties)
+        self.form_score = self._calculate_form_score(penalty)
         
-        return ExerciseResult(
+        return self._update_result(
             rep_count=self.rep_count,
             stage=self.stage,
             feedback=feedback_messages[0] if feedback_messages else f"Angle: {int(smoothed_angle)}°",
             form_score=self.form_score,
             is_valid_pose=True,
-            additional_data={"angle": smoothed_angle}
+            additional_data={"angle": smoothed_angle} if self.emit_additional_data else None
         )
     
-    def _calculate_angle(self, p1, p2, p3) -> float:
-        """Calculate angle at p2."""
-        a = np.array([p1[0], p1[1]])
-        b = np.array([p2[0], p2[1]])
-        c = np.array([p3[0], p3[1]])
-        
-        ba = a - b
-        bc = c - b
-        
-        cos_angle = np.dot(ba, bc) / (np.linalg.norm(ba) * np.linalg.norm(bc) + 1e-6)
-        cos_angle = np.clip(cos_angle, -1.0, 1.0)
-        return np.degrees(np.arccos(cos_angle))
-    
     def reset(self):
         """Reset tracker."""
         super().reset()
         self.stage = "down"
         self.angle = 0
-        self.angle_history.clear()
+        self.angle_filter.reset()
         self.initial_elbow_pos = None
     
     @property
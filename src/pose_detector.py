@@ -11,10 +11,15 @@ This module provides the PoseDetector class which handles:
 """
 
 import cv2
+import math
 import mediapipe as mp
 import numpy as np
 import time
-from typing import Dict, Tuple, Optional, List
+from collections import deque
+from typing import Dict, Tuple, Optional, Iterable, Deque
+
+from .utils.landmarks import LANDMARK_NAMES, LANDMARK_INDICES
+from .utils._kernels import joint_angle
 
 
 class PoseDetector:
@@ -28,44 +33,13 @@ class PoseDetector:
     """
     
     # MediaPipe landmark indices mapping
-    LANDMARK_NAMES = {
-        0: "nose",
-        1: "left_eye_inner",
-        2: "left_eye",
-        3: "left_eye_outer",
-        4: "right_eye_inner",
-        5: "right_eye",
-        6: "right_eye_outer",
-        7: "left_ear",
-        8: "right_ear",
-        9: "mouth_left",
-        10: "mouth_right",
-        11: "left_shoulder",
-        12: "right_shoulder",
-        13: "left_elbow",
-        14: "right_elbow",
-        15: "left_wrist",
-        16: "right_wrist",
-        17: "left_pinky",
-        18: "right_pinky",
-        19: "left_index",
-        20: "right_index",
-        21: "left_thumb",
-        22: "right_thumb",
-        23: "left_hip",
-        24: "right_hip",
-        25: "left_knee",
-        26: "right_knee",
-        27: "left_ankle",
-        28: "right_ankle",
-        29: "left_heel",
-        30: "right_heel",
-        31: "left_foot_index",
-        32: "right_foot_index"
-    }
+    LANDMARK_NAMES = LANDMARK_NAMES
     
     # Reverse mapping: name to index
-    LANDMARK_INDICES = {v: k for k, v in LANDMARK_NAMES.items()}
+    LANDMARK_INDICES = LANDMARK_INDICES
+    
+    # Number of frames averaged for the FPS reading
+    FPS_WINDOW = 30
     
     def __init__(
         self,
@@ -74,7 +48,8 @@ class PoseDetector:
         smooth_landmarks: bool = True,
         enable_segmentation: bool = False,
         min_detection_confidence: float = 0.5,
-        min_tracking_confidence: float = 0.5
+        min_tracking_confidence: float = 0.5,
+        inference_width: Optional[int] = None
     ):
         """
         Initialize the PoseDetector.
@@ -86,6 +61,9 @@ class PoseDetector:
             enable_segmentation: Whether to enable segmentation mask
             min_detection_confidence: Minimum confidence for person detection
             min_tracking_confidence: Minimum confidence for landmark tracking
+            inference_width: Width frames are downscaled to before detection
+                (None or 0 to detect on the full-resolution frame). Landmarks
+                are normalized, so they still map onto the original frame.
         """
         # Initialize MediaPipe Pose
         self.mp_pose = mp.solutions.pose
@@ -105,15 +83,25 @@ class PoseDetector:
         # Store configuration
         self.min_detection_confidence = min_detection_confidence
         self.min_tracking_confidence = min_tracking_confidence
+        self.inference_width = inference_width
         
         # Landmarks storage
         self.landmarks = None
         self.world_landmarks = None
         self.results = None
         
-        # FPS calculation
-        self.prev_time = 0
+        # Reused downscale and BGR->RGB conversion targets (MediaPipe copies
+        # the input)
+        self._small_buf: Optional[np.ndarray] = None
+        self._rgb_buf: Optional[np.ndarray] = None
+        
+        # (style key, (landmark spec, connection spec)) for draw_landmarks
+        self._spec_cache: Tuple[Optional[tuple], Optional[tuple]] = (None, None)
+        
+        # FPS calculation over a sliding window of frame timestamps (ns)
+        self._frame_times: Deque[int] = deque(maxlen=self.FPS_WINDOW)
         self.fps = 0
+        self._fps_label = (0, "FPS: 0")
         
     def process_frame(self, frame: np.ndarray) -> np.ndarray:
         """
@@ -125,11 +113,15 @@ class PoseDetector:
         Returns:
             The processed frame (can be used for further processing)
         """
-        # Convert BGR to RGB for MediaPipe
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        small = self._inference_frame(frame)
+        
+        # Convert BGR to RGB for MediaPipe into a buffer reused across frames
+        if self._rgb_buf is None or self._rgb_buf.shape != small.shape:
+            self._rgb_buf = np.empty_like(small)
+        cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
         
         # Make detection
-        self.results = self.pose.process(rgb_frame)
+        self.results = self.pose.process(self._rgb_buf)
         
         # Store landmarks if detected
         if self.results.pose_landmarks:
@@ -144,6 +136,43 @@ class PoseDetector:
         
         return frame
     
+    def _inference_frame(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Get the frame to run pose detection on.
+        
+        Frames wider than inference_width are downscaled (keeping the aspect
+        ratio) into a reused buffer.
+        
+        Args:
+            frame: Full-resolution BGR frame
+            
+        Returns:
+            Downscaled frame, or the frame itself if no downscaling is needed
+        """
+        h, w = frame.shape[:2]
+        if not self.inference_width or w <= self.inference_width:
+            return frame
+        
+        size = (self.inference_width, max(1, round(h * self.inference_width / w)))
+        if self._small_buf is None or self._small_buf.shape[1::-1] != size:
+            self._small_buf = np.empty((size[1], size[0], 3), dtype=np.uint8)
+        
+        cv2.resize(frame, size, dst=self._small_buf, interpolation=cv2.INTER_AREA)
+        return self._small_buf
+    
+    def step(self, frame: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Process a frame and return its landmarks in one call.
+        
+        Args:
+            frame: BGR image from OpenCV (numpy array)
+            
+        Returns:
+            Normalized landmark array of shape (33, 4), or None if no pose was detected
+        """
+        self.process_frame(frame)
+        return self.get_landmarks_array()
+    
     def draw_landmarks(
         self,
         frame: np.ndarray,
@@ -151,7 +180,8 @@ class PoseDetector:
         landmark_color: Tuple[int, int, int] = (0, 255, 0),
         connection_color: Tuple[int, int, int] = (255, 255, 255),
         thickness: int = 2,
-        circle_radius: int = 3
+        circle_radius: int = 3,
+        subset: Optional[Iterable[int]] = None
     ) -> np.ndarray:
         """
         Draw pose landmarks and skeleton on the frame.
@@ -163,28 +193,78 @@ class PoseDetector:
             connection_color: BGR color for connections
             thickness: Line thickness
             circle_radius: Radius of landmark circles
+            subset: Optional landmark indices to draw; connections are only
+                drawn when both endpoints are in the subset
             
         Returns:
             Frame with landmarks drawn
         """
+        if subset is not None:
+            if self.landmarks is not None:
+                self._draw_landmark_subset(
+                    frame, set(subset), draw_connections,
+                    landmark_color, connection_color, thickness, circle_radius
+                )
+            return frame
+        
         if self.results and self.results.pose_landmarks:
+            # Drawing specs only change with the style arguments
+            key = (landmark_color, connection_color, thickness, circle_radius)
+            if self._spec_cache[0] != key:
+                self._spec_cache = (key, (
+                    self.mp_drawing.DrawingSpec(
+                        color=landmark_color,
+                        thickness=thickness,
+                        circle_radius=circle_radius
+                    ),
+                    self.mp_drawing.DrawingSpec(
+                        color=connection_color,
+                        thickness=thickness
+                    )
+                ))
+            landmark_spec, connection_spec = self._spec_cache[1]
+            
             # Use custom drawing for more control
             self.mp_drawing.draw_landmarks(
                 frame,
                 self.results.pose_landmarks,
                 self.mp_pose.POSE_CONNECTIONS if draw_connections else None,
-                landmark_drawing_spec=self.mp_drawing.DrawingSpec(
-                    color=landmark_color,
-                    thickness=thickness,
-                    circle_radius=circle_radius
-                ),
-                connection_drawing_spec=self.mp_drawing.DrawingSpec(
-                    color=connection_color,
-                    thickness=thickness
-                )
+                landmark_drawing_spec=landmark_spec,
+                connection_drawing_spec=connection_spec
             )
         return frame
     
+    def _draw_landmark_subset(
+        self,
+        frame: np.ndarray,
+        subset: set,
+        draw_connections: bool,
+        landmark_color: Tuple[int, int, int],
+        connection_color: Tuple[int, int, int],
+        thickness: int,
+        circle_radius: int
+    ):
+        """Draw only the given landmarks, styled like MediaPipe's drawing utils."""
+        h, w = frame.shape[:2]
+        
+        # Pixel positions of visible, in-frame landmarks
+        points = {}
+        for idx in subset:
+            lm = self.landmarks[idx]
+            if lm.visibility < 0.5 or not (0 <= lm.x <= 1 and 0 <= lm.y <= 1):
+                continue
+            points[idx] = (min(int(lm.x * w), w - 1), min(int(lm.y * h), h - 1))
+        
+        if draw_connections:
+            for start, end in self.mp_pose.POSE_CONNECTIONS:
+                if start in points and end in points:
+                    cv2.line(frame, points[start], points[end], connection_color, thickness)
+        
+        border_radius = max(circle_radius + 1, int(circle_radius * 1.2))
+        for point in points.values():
+            cv2.circle(frame, point, border_radius, self.mp_drawing.WHITE_COLOR, thickness)
+            cv2.circle(frame, point, circle_radius, landmark_color, thickness)
+    
     def get_landmark(
         self,
         name: str,
@@ -207,11 +287,13 @@ class PoseDetector:
         if self.landmarks is None:
             return None
             
-        name_lower = name.lower()
-        if name_lower not in self.LANDMARK_INDICES:
-            raise ValueError(f"Unknown landmark name: {name}. Valid names: {list(self.LANDMARK_INDICES.keys())}")
+        # Names are normally already lowercase; only normalize on a miss
+        idx = self.LANDMARK_INDICES.get(name)
+        if idx is None:
+            idx = self.LANDMARK_INDICES.get(name.lower())
+            if idx is None:
+                raise ValueError(f"Unknown landmark name: {name}. Valid names: {list(self.LANDMARK_INDICES.keys())}")
             
-        idx = self.LANDMARK_INDICES[name_lower]
         landmark = self.landmarks[idx]
         
         x, y, z = landmark.x, landmark.y, landmark.z
@@ -242,19 +324,59 @@ class PoseDetector:
         if self.landmarks is None:
             return {}
             
-        landmarks_dict = {}
-        for idx, name in self.LANDMARK_NAMES.items():
-            landmark = self.landmarks[idx]
-            x, y, z = landmark.x, landmark.y, landmark.z
-            visibility = landmark.visibility
+        # LANDMARK_NAMES is ordered by index, so names zip with the landmark list
+        names = self.LANDMARK_NAMES.values()
+        
+        if frame_width and frame_height:
+            return {
+                name: (lm.x * frame_width, lm.y * frame_height, lm.z, lm.visibility)
+                for name, lm in zip(names, self.landmarks)
+            }
+        
+        return {
+            name: (lm.x, lm.y, lm.z, lm.visibility)
+            for name, lm in zip(names, self.landmarks)
+        }
+    
+    def get_landmarks_array(
+        self,
+        frame_width: Optional[int] = None,
+        frame_height: Optional[int] = None,
+        dtype: np.dtype = np.float32
+    ) -> Optional[np.ndarray]:
+        """
+        Get all landmarks as a single array.
+        
+        Rows follow LANDMARK_NAMES order and columns are (x, y, z, visibility),
+        so a column such as visibility can be tested in one vectorized call.
+        
+        Pass dtype=np.float16 for compact storage (e.g. when buffering many
+        frames). Normalized coordinates keep ~3 significant digits and the
+        default 0.5 visibility threshold is exactly representable; trackers
+        convert rows to Python floats before doing any math.
+        
+        Args:
+            frame_width: Optional frame width for pixel coordinate conversion
+            frame_height: Optional frame height for pixel coordinate conversion
+            dtype: Array dtype (float32 by default)
             
-            if frame_width and frame_height:
-                x = x * frame_width
-                y = y * frame_height
-                
-            landmarks_dict[name] = (x, y, z, visibility)
+        Returns:
+            Array of shape (33, 4), or None if no pose was detected
+        """
+        if self.landmarks is None:
+            return None
+        
+        arr = np.array(
+            [(lm.x, lm.y, lm.z, lm.visibility) for lm in self.landmarks],
+            dtype=np.float32
+        )
+        
+        # Scale before any narrowing so pixel coordinates are computed in fp32
+        if frame_width and frame_height:
+            arr[:, 0] *= frame_width
+            arr[:, 1] *= frame_height
             
-        return landmarks_dict
+        return arr if arr.dtype == dtype else arr.astype(dtype)
     
     @staticmethod
     def calculate_angle(
@@ -275,25 +397,8 @@ class PoseDetector:
         Returns:
             Angle in degrees (0-180)
         """
-        # Extract x, y coordinates (ignore z for 2D angle)
-        a = np.array([point1[0], point1[1]])
-        b = np.array([point2[0], point2[1]])
-        c = np.array([point3[0], point3[1]])
-        
-        # Calculate vectors
-        ba = a - b
-        bc = c - b
-        
-        # Calculate angle using dot product
-        cosine_angle = np.dot(ba, bc) / (np.linalg.norm(ba) * np.linalg.norm(bc) + 1e-6)
-        
-        # Clip to avoid numerical errors with arccos
-        cosine_angle = np.clip(cosine_angle, -1.0, 1.0)
-        
-        # Convert to degrees
-        angle = np.degrees(np.arccos(cosine_angle))
-        
-        return angle
+        # 2D angle (z is ignored) via the shared scalar kernel
+        return joint_angle(point1[0], point1[1], point2[0], point2[1], point3[0], point3[1])
     
     @staticmethod
     def calculate_distance(
@@ -310,15 +415,15 @@ class PoseDetector:
         Returns:
             Distance between the points
         """
-        return np.sqrt((point2[0] - point1[0])**2 + (point2[1] - point1[1])**2)
+        return math.hypot(point2[0] - point1[0], point2[1] - point1[1])
     
     def _update_fps(self):
-        """Update FPS calculation."""
-        current_time = time.time()
-        time_diff = current_time - self.prev_time
-        if time_diff > 0:
-            self.fps = 1 / time_diff
-        self.prev_time = current_time
+        """Update FPS as the average rate over the last FPS_WINDOW frames."""
+        frame_times = self._frame_times
+        frame_times.append(time.perf_counter_ns())
+        elapsed = frame_times[-1] - frame_times[0]
+        if elapsed > 0:
+            self.fps = (len(frame_times) - 1) * 1e9 / elapsed
         
     def draw_fps(
         self,
@@ -341,9 +446,14 @@ class PoseDetector:
         Returns:
             Frame with FPS drawn
         """
+        # The label only changes when the whole-number FPS does
+        fps = int(self.fps)
+        if fps != self._fps_label[0]:
+            self._fps_label = (fps, f"FPS: {fps}")
+        
         cv2.putText(
             frame,
-            f"FPS: {int(self.fps)}",
+            self._fps_label[1],
             position,
             cv2.FONT_HERSHEY_SIMPLEX,
             font_scale,
@@ -384,13 +494,15 @@ class WebcamCapture:
         camera_id (int): Camera device ID
         width (int): Frame width
         height (int): Frame height
+        fourcc (str): Requested capture codec, or None for the driver default
     """
     
     def __init__(
         self,
         camera_id: int = 0,
         width: int = 1280,
-        height: int = 720
+        height: int = 720,
+        fourcc: Optional[str] = None
     ):
         """
         Initialize webcam capture.
@@ -399,10 +511,13 @@ class WebcamCapture:
             camera_id: Camera device ID (0 for default camera)
             width: Desired frame width
             height: Desired frame height
+            fourcc: Optional capture codec such as "MJPG" (cheaper to decode
+                than H.264 on most USB cameras)
         """
         self.camera_id = camera_id
         self.width = width
         self.height = height
+        self.fourcc = fourcc
         self.cap = None
         
     def start(self) -> bool:
@@ -417,6 +532,15 @@ class WebcamCapture:
         if not self.cap.isOpened():
             print(f"Error: Could not open camera {self.camera_id}")
             return False
+        
+        # Keep only the newest frame queued in the driver so a slow consumer
+        # gets a fresh frame rather than a backlog (ignored where unsupported)
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        
+        # Set codec before resolution; some drivers only offer high
+        # resolutions in MJPG
+        if self.fourcc:
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*self.fourcc))
             
         # Set resolution
         self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
@@ -429,15 +553,24 @@ class WebcamCapture:
         print(f"Camera started at {self.width}x{self.height}")
         return True
     
-    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+    def read(self, skip: int = 0) -> Tuple[bool, Optional[np.ndarray]]:
         """
         Read a frame from the webcam.
         
+        Skipped frames are only grabbed, not decoded, so a consumer that
+        cannot keep up with the camera can drop frames cheaply.
+        
+        Args:
+            skip: Number of frames to discard before the returned frame
+            
         Returns:
             Tuple of (success, frame)
         """
         if self.cap is None:
             return False, None
+        for _ in range(skip):
+            if not self.cap.grab():
+                return False, None
         return self.cap.read()
     
     def get_frame_dimensions(self) -> Tuple[int, int]:
@@ -505,7 +638,6 @@ if __name__ == "__main__":
                 )
                 
             # Calculate and display elbow angle
-            left_shoulder = detector.get_landmark("left_shoulder")
             left_elbow = detector.get_landmark("left_elbow")
             left_wrist = detector.get_landmark("left_wrist")
             
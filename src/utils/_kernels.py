@@ -0,0 +1,81 @@
+"""
+Geometry Kernels
+================
+Scalar geometry kernels shared by the pose detector, helpers and exercise
+trackers.
+
+Kernels are written in scalar ``math`` style (no temporary NumPy arrays
+per call), which is already fast as plain Python. Numba is not a
+dependency; if it happens to be installed the kernels are compiled with
+it, for a small per-call gain. Angles use atan2, which stays accurate
+near 0 and 180 degrees where acos does not.
+"""
+
+import math
+
+# Try to import Numba for JIT compilation
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit("float64(float64, float64, float64, float64, float64, float64)", cache=True)
+def joint_angle(
+    ax: float, ay: float,
+    bx: float, by: float,
+    cx: float, cy: float
+) -> float:
+    """
+    Calculate the 2D angle at point b between points a and c.
+    
+    Args:
+        ax, ay: First point
+        bx, by: Vertex point
+        cx, cy: Third point
+        
+    Returns:
+        Angle in degrees (0-180), 0 if a point coincides with b
+    """
+    bax = ax - bx
+    bay = ay - by
+    bcx = cx - bx
+    bcy = cy - by
+    
+    # atan2(|cross|, dot) is accurate over the whole 0-180 range and needs
+    # no normalization or clipping (unlike acos near 0 and 180)
+    cross = bax * bcy - bay * bcx
+    dot = bax * bcx + bay * bcy
+    
+    return math.degrees(math.atan2(abs(cross), dot))
+
+
+@njit("float64(float64, float64, float64, float64)", cache=True)
+def angle_from_vertical(
+    ax: float, ay: float,
+    bx: float, by: float
+) -> float:
+    """
+    Calculate the angle between the vector a->b and straight down.
+    
+    Image y grows downward, so 0 means b is directly below a and 180
+    means b is directly above it.
+    
+    Args:
+        ax, ay: Start point
+        bx, by: End point
+        
+    Returns:
+        Angle in degrees (0-180), 0 if the points coincide
+    """
+    dx = bx - ax
+    dy = by - ay
+    
+    return math.degrees(math.atan2(abs(dx), dy))
@@ -4,10 +4,13 @@ Helper Utilities
 General helper functions for the Fitness Coach application.
 """
 
-import numpy as np
-from typing import Tuple, List, Dict, Any
+import math
+from collections import deque
+from typing import Tuple, Deque
 import time
 
+from ._kernels import joint_angle
+
 
 def calculate_angle(
     point1: Tuple[float, float],
@@ -25,17 +28,7 @@ def calculate_angle(
     Returns:
         Angle in degrees (0-180)
     """
-    a = np.array([point1[0], point1[1]])
-    b = np.array([point2[0], point2[1]])
-    c = np.array([point3[0], point3[1]])
-    
-    ba = a - b
-    bc = c - b
-    
-    cosine_angle = np.dot(ba, bc) / (np.linalg.norm(ba) * np.linalg.norm(bc) + 1e-6)
-    cosine_angle = np.clip(cosine_angle, -1.0, 1.0)
-    
-    return np.degrees(np.arccos(cosine_angle))
+    return joint_angle(point1[0], point1[1], point2[0], point2[1], point3[0], point3[1])
 
 
 def calculate_distance(
@@ -52,7 +45,7 @@ def calculate_distance(
     Returns:
         Distance
     """
-    return np.sqrt((point2[0] - point1[0])**2 + (point2[1] - point1[1])**2)
+    return math.hypot(point2[0] - point1[0], point2[1] - point1[1])
 
 
 def normalize_coordinates(
@@ -100,6 +93,8 @@ def denormalize_coordinates(
 class SmoothingFilter:
     """
     Simple moving average filter for smoothing values.
+    
+    Keeps a running sum of the window so each update is O(1).
     """
     
     def __init__(self, window_size: int = 5):
@@ -110,7 +105,8 @@ class SmoothingFilter:
             window_size: Number of samples to average
         """
         self.window_size = window_size
-        self.values: List[float] = []
+        self.values: Deque[float] = deque(maxlen=window_size)
+        self._sum = 0.0
     
     def add(self, value: float) -> float:
         """
@@ -122,19 +118,22 @@ class SmoothingFilter:
         Returns:
             Smoothed value
         """
-        self.values.append(value)
-        if len(self.values) > self.window_size:
-            self.values.pop(0)
-        return np.mean(self.values)
+        values = self.values
+        if len(values) == self.window_size:
+            self._sum -= values[0]
+        values.append(value)
+        self._sum += value
+        return self._sum / len(values)
     
     def reset(self):
         """Clear the filter history."""
         self.values.clear()
+        self._sum = 0.0
     
     @property
     def current(self) -> float:
         """Get current smoothed value."""
-        return np.mean(self.values) if self.values else 0
+        return self._sum / len(self.values) if self.values else 0
 
 
 class FPSCounter:
@@ -150,7 +149,7 @@ class FPSCounter:
             window_size: Number of frames to average
         """
         self.window_size = window_size
-        self.times: List[float] = []
+        self.times: Deque[float] = deque(maxlen=window_size)
         self.last_time = time.time()
     
     def tick(self) -> float:
@@ -166,15 +165,13 @@ class FPSCounter:
         
         if delta > 0:
             self.times.append(1 / delta)
-            if len(self.times) > self.window_size:
-                self.times.pop(0)
         
-        return np.mean(self.times) if self.times else 0
+        return self.fps
     
     @property
     def fps(self) -> float:
         """Get current FPS."""
-        return np.mean(self.times) if self.times else 0
+        return sum(self.times) / len(self.times) if self.times else 0
 
 
 class RateLimiter:
@@ -0,0 +1,57 @@
+"""
+Landmark Definitions
+====================
+MediaPipe Pose landmark names and indices.
+
+Kept free of MediaPipe/OpenCV imports so exercise trackers can map
+landmark names to rows of a (33, 4) landmark array.
+"""
+
+from typing import Dict
+
+
+# Number of landmarks produced by MediaPipe Pose
+NUM_LANDMARKS = 33
+
+# Columns of a landmark array row
+X, Y, Z, VISIBILITY = 0, 1, 2, 3
+
+# MediaPipe landmark indices mapping
+LANDMARK_NAMES: Dict[int, str] = {
+    0: "nose",
+    1: "left_eye_inner",
+    2: "left_eye",
+    3: "left_eye_outer",
+    4: "right_eye_inner",
+    5: "right_eye",
+    6: "right_eye_outer",
+    7: "left_ear",
+    8: "right_ear",
+    9: "mouth_left",
+    10: "mouth_right",
+    11: "left_shoulder",
+    12: "right_shoulder",
+    13: "left_elbow",
+    14: "right_elbow",
+    15: "left_wrist",
+    16: "right_wrist",
+    17: "left_pinky",
+    18: "right_pinky",
+    19: "left_index",
+    20: "right_index",
+    21: "left_thumb",
+    22: "right_thumb",
+    23: "left_hip",
+    24: "right_hip",
+    25: "left_knee",
+    26: "right_knee",
+    27: "left_ankle",
+    28: "right_ankle",
+    29: "left_heel",
+    30: "right_heel",
+    31: "left_foot_index",
+    32: "right_foot_index"
+}
+
+# Reverse mapping: name to index
+LANDMARK_INDICES: Dict[str, int] = {v: k for k, v in LANDMARK_NAMES.items()}
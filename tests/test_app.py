@@ -0,0 +1,279 @@
+"""
+Unit Tests for App UI Rendering
+===============================
+Tests for the UIRenderer drawing helpers.
+"""
+
+import pytest
+import numpy as np
+import cv2
+import sys
+import threading
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.app import UIRenderer, OverlayLayer, VoiceFeedback, FitnessCoachApp
+from src.utils.landmarks import LANDMARK_INDICES
+
+
+def blend_rounded_rect(img, pt1, pt2, color, radius=10, alpha=0.7):
+    """Blend a filled rounded rectangle over the whole frame (reference drawing)."""
+    overlay = img.copy()
+    (x1, y1), (x2, y2) = pt1, pt2
+    cv2.rectangle(overlay, (x1 + radius, y1), (x2 - radius, y2), color, -1)
+    cv2.rectangle(overlay, (x1, y1 + radius), (x2, y2 - radius), color, -1)
+    cv2.ellipse(overlay, (x1 + radius, y1 + radius), (radius, radius), 180, 0, 90, color, -1)
+    cv2.ellipse(overlay, (x2 - radius, y1 + radius), (radius, radius), 270, 0, 90, color, -1)
+    cv2.ellipse(overlay, (x1 + radius, y2 - radius), (radius, radius), 90, 0, 90, color, -1)
+    cv2.ellipse(overlay, (x2 - radius, y2 - radius), (radius, radius), 0, 0, 90, color, -1)
+    cv2.addWeighted(overlay, alpha, img, 1 - alpha, 0, img)
+
+
+class TestOverlayLayer:
+    """Tests for ROI-only panel compositing."""
+    
+    def test_matches_full_frame_blend(self):
+        """Test that a layer matches blending the panel over the whole frame."""
+        img = np.random.default_rng(0).integers(0, 255, (120, 200, 3), dtype=np.uint8)
+        expected = img.copy()
+        blend_rounded_rect(expected, (10, 10), (150, 90), (255, 128, 0), alpha=0.6)
+        
+        OverlayLayer(140, 80, (255, 128, 0), alpha=0.6).finish().composite(img, (10, 10))
+        
+        assert np.abs(img.astype(int) - expected).max() <= 1
+    
+    def test_contents_match_direct_drawing(self):
+        """Test that layer contents match blending the background then drawing on top."""
+        img = np.random.default_rng(0).integers(0, 255, (120, 200, 3), dtype=np.uint8)
+        expected = img.copy()
+        blend_rounded_rect(expected, (10, 10), (150, 90), (0, 0, 0), alpha=0.6)
+        cv2.putText(expected, "REPS", (20, 40), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2)
+        cv2.rectangle(expected, (20, 60), (120, 70), (50, 50, 50), -1)
+        
+        layer = OverlayLayer(140, 80, (0, 0, 0), alpha=0.6)
+        layer.put_text("REPS", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2)
+        layer.rectangle((10, 50), (110, 60), (50, 50, 50))
+        layer.finish().composite(img, (10, 10))
+        
+        assert np.abs(img.astype(int) - expected).max() <= 2
+    
+    def test_outside_region_untouched(self):
+        """Test that pixels outside the panel are not modified."""
+        img = np.full((100, 200, 3), 200, dtype=np.uint8)
+        OverlayLayer(50, 40, (0, 0, 0), alpha=0.5).finish().composite(img, (10, 10))
+        
+        assert (img[60:, :] == 200).all()
+        assert (img[:, 70:] == 200).all()
+    
+    def test_rounded_corners(self):
+        """Test that the extreme corner pixel is outside the rounded shape."""
+        mask = OverlayLayer._rounded_rect_mask(50, 40, 10)
+        
+        assert not mask[0, 0] and not mask[40, 50]
+        assert mask[20, 25] and mask[0, 25] and mask[20, 0]
+    
+    def test_clipped_to_image(self):
+        """Test that layers extending past the image are clipped."""
+        img = np.full((50, 50, 3), 200, dtype=np.uint8)
+        OverlayLayer(100, 100, (0, 0, 0), alpha=0.5).finish().composite(img, (-20, -20))
+        
+        assert (img[25, 25] == 100).all()
+    
+    def test_help_layer_cached_per_renderer(self):
+        """Test that each renderer builds the help layer once per frame size."""
+        img = np.zeros((480, 640, 3), dtype=np.uint8)
+        ui = UIRenderer()
+        ui.draw_controls_help(img)
+        layer = ui._help_cache[(640, 480)]
+        ui.draw_controls_help(img)
+        
+        assert ui._help_cache[(640, 480)] is layer
+        assert UIRenderer()._help_cache == {}
+    
+    def test_info_panel_reused(self):
+        """Test that an unchanged panel state reuses the cached layer."""
+        img = np.zeros((480, 640, 3), dtype=np.uint8)
+        ui = UIRenderer()
+        ui.draw_info_panel(img, "squat", 3, "up", "Good", 80, 30)
+        layer = ui._info_panel_cache[1]
+        ui.draw_info_panel(img, "squat", 3, "up", "Good", 80, 29)
+        assert ui._info_panel_cache[1] is layer
+        
+        ui.draw_info_panel(img, "squat", 4, "up", "Good", 80, 29)
+        assert ui._info_panel_cache[1] is not layer
+
+
+class TestColorLookup:
+    """Tests for score color and feedback classification lookups."""
+    
+    @pytest.mark.parametrize("score,color", [
+        (0, 'red'), (39.9, 'red'), (40, 'yellow'),
+        (69.9, 'yellow'), (70, 'green'), (100, 'green')
+    ])
+    def test_score_color_thresholds(self, score, color):
+        """Test that the LUT matches the red/yellow/green thresholds."""
+        assert UIRenderer.score_color(score) == UIRenderer.COLORS[color]
+    
+    def test_score_color_out_of_range(self):
+        """Test that out-of-range scores are clamped."""
+        assert UIRenderer.score_color(-10) == UIRenderer.COLORS['red']
+        assert UIRenderer.score_color(150) == UIRenderer.COLORS['green']
+    
+    def test_classify_feedback(self):
+        """Test positive and warning markers."""
+        assert UIRenderer.classify_feedback("Full range of motion! ✓") == (True, True)
+        assert UIRenderer.classify_feedback("Don't swing your body! 🚫") == (False, True)
+        assert UIRenderer.classify_feedback("Angle: 90°") == (False, False)
+
+
+class TestVoiceFeedback:
+    """Tests for the non-blocking voice queue."""
+    
+    @pytest.fixture
+    def voice(self, monkeypatch):
+        """Create a voice feedback object with a stand-in engine and no worker."""
+        monkeypatch.setattr("src.app.VOICE_AVAILABLE", False)
+        voice = VoiceFeedback()
+        voice.engine = object()
+        voice.enabled = True
+        return voice
+    
+    def test_speak_does_not_block(self, voice):
+        """Test that speak only queues the message."""
+        voice.speak("1")
+        assert voice._tts_q.get_nowait() == "1"
+    
+    def test_cooldown(self, voice):
+        """Test that messages inside the cooldown are skipped unless forced."""
+        voice.speak("1")
+        voice.speak("2")
+        voice.speak("3", force=True)
+        
+        assert voice._tts_q.qsize() == 2
+    
+    def test_drops_stalest_when_full(self, voice):
+        """Test that the oldest pending message is dropped when the queue is full."""
+        for i in range(VoiceFeedback.QUEUE_SIZE + 2):
+            voice.speak_async(str(i))
+        
+        assert voice._tts_q.qsize() == VoiceFeedback.QUEUE_SIZE
+        assert voice._tts_q.get_nowait() == "2"
+
+
+class FakeWebcam:
+    """Webcam stand-in that returns a fresh blank frame on every read."""
+    
+    def __init__(self, *args, **kwargs):
+        self.released = False
+    
+    def start(self):
+        return True
+    
+    def read(self):
+        return True, np.zeros((240, 320, 3), dtype=np.uint8)
+    
+    def release(self):
+        self.released = True
+
+
+class FakeDetector:
+    """Pose detector stand-in that alternates between a pose and no pose."""
+    
+    def __init__(self, *args, **kwargs):
+        self.fps = 30.0
+        self.frames = 0
+        self.released = False
+        self.landmarks = np.random.default_rng(0).uniform(0.2, 0.8, (33, 4))
+        self.landmarks[:, 3] = 1.0
+    
+    def step(self, frame):
+        self.frames += 1
+        return self.landmarks if self.frames % 2 else None
+    
+    def draw_landmarks(self, frame, subset=None):
+        self.subset = subset
+    
+    def release(self):
+        self.released = True
+
+
+class TestPipeline:
+    """Tests for the threaded reader -> processing -> display pipeline."""
+    
+    @pytest.fixture
+    def app(self, monkeypatch):
+        """Create an app wired to the fake webcam and detector."""
+        monkeypatch.setattr("src.app.VOICE_AVAILABLE", False)
+        monkeypatch.setattr("src.app.PoseDetector", FakeDetector)
+        monkeypatch.setattr("src.app.WebcamCapture", FakeWebcam)
+        app = FitnessCoachApp(starting_exercise='bicep_curl', voice_enabled=False)
+        
+        # Record what the info panel is asked to show
+        app.panels = []
+        draw_info_panel = app.ui.draw_info_panel
+        
+        def record_info_panel(frame, **kwargs):
+            app.panels.append(kwargs)
+            draw_info_panel(frame, **kwargs)
+        
+        monkeypatch.setattr(app.ui, "draw_info_panel", record_info_panel)
+        return app
+    
+    def test_no_pose_result(self, app):
+        """Test that frames without a pose show the no-pose result."""
+        frame = np.zeros((240, 320, 3), dtype=np.uint8)
+        app._process_frame(frame)
+        app._process_frame(frame)
+        
+        assert app.panels[0]["feedback"] != app._no_pose_result.feedback
+        assert app.panels[1]["feedback"] == app._no_pose_result.feedback
+        assert app.panels[1]["form_score"] == 0
+    
+    def test_invalid_overlay_rejected(self, monkeypatch):
+        """Test that an unknown overlay mode fails at construction."""
+        monkeypatch.setattr("src.app.PoseDetector", FakeDetector)
+        monkeypatch.setattr("src.app.WebcamCapture", FakeWebcam)
+        
+        with pytest.raises(ValueError):
+            FitnessCoachApp(overlay='skeletons')
+    
+    def test_required_overlay_subset(self, app):
+        """Test that the 'required' overlay draws the tracker's landmarks."""
+        app.overlay = 'required'
+        app._process_frame(np.zeros((240, 320, 3), dtype=np.uint8))
+        
+        assert list(app.detector.subset) == [
+            LANDMARK_INDICES[name] for name in app.tracker.get_required_landmarks()
+        ]
+    
+    def test_reader_keeps_newest_frames(self, app):
+        """Test that a full read queue drops its stalest frame."""
+        for i in range(FitnessCoachApp.QUEUE_SIZE + 2):
+            app._put_latest(app._read_q, i)
+        
+        assert app._read_q.qsize() == FitnessCoachApp.QUEUE_SIZE
+        assert app._read_q.get_nowait() == 2
+    
+    def test_run_switches_exercise_and_joins(self, app, monkeypatch):
+        """Test that a keyed exercise switch reaches the pipeline and threads stop."""
+        keys = iter([ord('2'), 0xFF, 0xFF, 0xFF])
+        monkeypatch.setattr("src.app.cv2.imshow", lambda name, frame: None)
+        monkeypatch.setattr("src.app.cv2.waitKey", lambda delay: next(keys, ord('q')))
+        monkeypatch.setattr("src.app.cv2.destroyAllWindows", lambda: None)
+        
+        assert 'squat' not in app.trackers
+        before = set(threading.enumerate())
+        app.run()
+        
+        assert set(threading.enumerate()) <= before
+        assert app.current_exercise == 'squat'
+        assert set(app.trackers) == {'bicep_curl', 'squat'}
+        assert app.detector.frames >= 5
+        assert app.panels[-1]["exercise_name"] == "Squat"
+        assert app.webcam.released and app.detector.released
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -20,6 +20,17 @@ from src.exercises.lateral_raise import LateralRaiseTracker
 from src.exercises.front_raise import FrontRaiseTracker
 from src.exercises.shoulder_shrug import ShoulderShrugTracker
 from src.exercises.tricep_extension import TricepExtensionTracker
+from src.utils._kernels import joint_angle, angle_from_vertical
+from src.utils.landmarks import LANDMARK_INDICES, NUM_LANDMARKS
+from src.utils.helpers import SmoothingFilter, calculate_angle
+
+
+def to_landmark_array(landmarks):
+    """Convert a landmark dictionary to a (33, 4) array (missing rows invisible)."""
+    arr = np.zeros((NUM_LANDMARKS, 4), dtype=np.float32)
+    for name, values in landmarks.items():
+        arr[LANDMARK_INDICES[name]] = values
+    return arr
 
 
 class TestBicepCurlTracker:
@@ -78,6 +89,36 @@ class TestBicepCurlTracker:
         result = tracker.process(landmarks, 640, 480)
         assert result.stage == "up"
     
+    def test_stability_flags(self, tracker):
+        """Test that additional_data reports the elbow stability check."""
+        landmarks = {
+            "left_shoulder": (0.3, 0.3, 0, 0.9),
+            "left_elbow": (0.3, 0.5, 0, 0.9),
+            "left_wrist": (0.3, 0.7, 0, 0.9),
+            "left_hip": (0.35, 0.6, 0, 0.9)
+        }
+        result = tracker.process(landmarks, 640, 480)
+        assert result.additional_data["elbow_stable"]
+        assert result.additional_data["body_stable"]
+        
+        # Elbow drifts far from the hip
+        landmarks["left_elbow"] = (0.1, 0.5, 0, 0.9)
+        result = tracker.process(landmarks, 640, 480)
+        assert not result.additional_data["elbow_stable"]
+    
+    def test_additional_data_disabled(self, tracker):
+        """Test that additional_data is skipped when not requested."""
+        tracker.emit_additional_data = False
+        landmarks = {
+            "left_shoulder": (0.3, 0.3, 0, 0.9),
+            "left_elbow": (0.3, 0.5, 0, 0.9),
+            "left_wrist": (0.3, 0.7, 0, 0.9),
+            "left_hip": (0.35, 0.6, 0, 0.9)
+        }
+        result = tracker.process(landmarks, 640, 480)
+        assert result.additional_data is None
+        assert result.is_valid_pose
+    
     def test_rep_counting(self, tracker):
         """Test full rep counting cycle."""
         # Start in down position
@@ -179,6 +220,17 @@ class TestSquatTracker:
         
         assert result.stage == "squat"
     
+    @pytest.mark.parametrize("side,knee_x,flagged", [
+        ("left", 0.4, True), ("left", 0.6, False),
+        ("right", 0.6, True), ("right", 0.4, False)
+    ])
+    def test_knee_position_direction(self, side, knee_x, flagged):
+        """Test that knee-over-toe overshoot follows the tracked side."""
+        tracker = SquatTracker(track_side=side)
+        penalty, _ = tracker._check_knee_position((knee_x, 0.7, 0, 0.9), (0.5, 0.9, 0, 0.9))
+        
+        assert (penalty > 0) == flagged
+    
     def test_rep_counting(self, tracker):
         """Test squat rep counting."""
         standing = {
@@ -311,6 +363,68 @@ class TestEdgeCases:
         assert result.is_valid_pose
 
 
+class TestFeedbackHistory:
+    """Tests for feedback history tracking."""
+    
+    def test_empty_feedback_not_recorded(self):
+        """Test that empty feedback is never added to history."""
+        tracker = BicepCurlTracker()
+        tracker._add_feedback("")
+        assert len(tracker.feedback_history) == 0
+    
+    def test_duplicates_not_recorded(self):
+        """Test that a recent message is only recorded once."""
+        tracker = BicepCurlTracker()
+        tracker._add_feedback("Great rep! 💪")
+        tracker._add_feedback("Great rep! 💪")
+        
+        assert list(tracker.feedback_history) == ["Great rep! 💪"]
+        assert tracker.feedback == "Great rep! 💪"
+    
+    def test_history_bounded(self):
+        """Test that only the most recent messages are kept."""
+        tracker = BicepCurlTracker()
+        for i in range(8):
+            tracker._add_feedback(f"msg {i}")
+        
+        assert list(tracker.feedback_history) == [f"msg {i}" for i in range(3, 8)]
+        
+        # Evicted messages can be recorded again
+        tracker._add_feedback("msg 0")
+        assert tracker.feedback_history[-1] == "msg 0"
+    
+    def test_reset_clears_history(self):
+        """Test that reset clears feedback history."""
+        tracker = BicepCurlTracker()
+        tracker._add_feedback("msg")
+        tracker.reset()
+        tracker._add_feedback("msg")
+        
+        assert list(tracker.feedback_history) == ["msg"]
+
+
+class TestSmoothingFilter:
+    """Tests for the moving average filter."""
+    
+    def test_matches_window_mean(self):
+        """Test that the running sum matches the mean of the last N values."""
+        values = [170.0, 150.0, 120.0, 90.0, 60.0, 45.0, 40.0, 90.0]
+        smoother = SmoothingFilter(window_size=5)
+        
+        for i, value in enumerate(values):
+            smoothed = smoother.add(value)
+            assert smoothed == pytest.approx(np.mean(values[max(0, i - 4):i + 1]))
+    
+    def test_reset(self):
+        """Test that reset clears the window."""
+        smoother = SmoothingFilter(window_size=3)
+        smoother.add(100.0)
+        smoother.reset()
+        
+        assert smoother.current == 0
+        assert smoother.add(10.0) == 10.0
+
+
 class TestAngleCalculations:
     """Tests for angle calculation in exercise trackers."""
     
@@ -337,6 +451,39 @@ class TestAngleCalculations:
         
         angle = tracker._calculate_angle(shoulder, elbow, wrist)
         assert 80 < angle < 100  # Should be close to 90
+    
+    def test_joint_angle_kernel_matches_numpy(self):
+        """Test the scalar angle kernel against the NumPy formula."""
+        rng = np.random.default_rng(0)
+        for a, b, c in rng.random((50, 3, 2)):
+            ba = a - b
+            bc = c - b
+            cosine = np.dot(ba, bc) / (np.linalg.norm(ba) * np.linalg.norm(bc))
+            expected = np.degrees(np.arccos(np.clip(cosine, -1.0, 1.0)))
+            
+            assert abs(joint_angle(a[0], a[1], b[0], b[1], c[0], c[1]) - expected) < 1e-6
+    
+    @pytest.mark.parametrize("c,expected", [((1.0, 0.0), 0), ((-1.0, 0.0), 180), ((0.0, 1.0), 90)])
+    def test_joint_angle_kernel_exact_at_extremes(self, c, expected):
+        """Test that straight and folded joints give exact angles."""
+        assert joint_angle(2.0, 0.0, 0.0, 0.0, c[0], c[1]) == pytest.approx(expected, abs=1e-9)
+    
+    def test_joint_angle_kernel_degenerate(self):
+        """Test that coincident points do not raise."""
+        angle = joint_angle(0.5, 0.5, 0.5, 0.5, 0.5, 0.5)
+        assert 0 <= angle <= 180
+    
+    def test_helpers_calculate_angle(self):
+        """Test that the helper angle function uses the shared kernel."""
+        assert calculate_angle((0, 0), (1, 0), (1, 1)) == pytest.approx(90.0)
+        assert calculate_angle((0.2, 0.3), (0.5, 0.5), (0.9, 0.1)) == joint_angle(0.2, 0.3, 0.5, 0.5, 0.9, 0.1)
+    
+    @pytest.mark.parametrize("end,expected", [
+        ((0.5, 0.8), 0), ((0.8, 0.5), 90), ((0.5, 0.2), 180), ((0.8, 0.8), 45)
+    ])
+    def test_angle_from_vertical(self, end, expected):
+        """Test angles measured from straight down."""
+        assert angle_from_vertical(0.5, 0.5, end[0], end[1]) == pytest.approx(expected, abs=1e-9)
 
 
 class TestShoulderPressTracker:
@@ -445,5 +592,111 @@ class TestTricepExtensionTracker:
         assert "left_wrist" in required
 
 
+class TestLandmarkArray:
+    """Tests for processing landmarks passed as a (33, 4) array."""
+    
+    DOWN = {
+        "left_shoulder": (0.3, 0.3, 0, 0.9),
+        "left_elbow": (0.3, 0.5, 0, 0.9),
+        "left_wrist": (0.3, 0.7, 0, 0.9),
+        "left_hip": (0.35, 0.6, 0, 0.9)
+    }
+    UP = {
+        "left_shoulder": (0.3, 0.3, 0, 0.9),
+        "left_elbow": (0.3, 0.5, 0, 0.9),
+        "left_wrist": (0.32, 0.32, 0, 0.9),
+        "left_hip": (0.35, 0.6, 0, 0.9)
+    }
+    
+    def test_visibility_check_array(self):
+        """Test vectorized visibility check on an array."""
+        tracker = BicepCurlTracker()
+        assert tracker.check_landmarks_visibility(to_landmark_array(self.DOWN)) == (True, [])
+    
+    def test_visibility_check_array_missing(self):
+        """Test that hidden landmarks are reported by name."""
+        tracker = BicepCurlTracker()
+        landmarks = dict(self.DOWN, left_wrist=(0.3, 0.7, 0, 0.2))
+        
+        is_valid, missing = tracker.check_landmarks_visibility(to_landmark_array(landmarks))
+        assert not is_valid
+        assert missing == ["left_wrist"]
+    
+    def test_matches_dict_processing(self):
+        """Test that array and dict inputs give the same results."""
+        dict_tracker = BicepCurlTracker()
+        array_tracker = BicepCurlTracker()
+        
+        for landmarks in [self.DOWN] * 3 + [self.UP] * 5 + [self.DOWN] * 5:
+            expected = dict_tracker.process(landmarks, 640, 480)
+            result = array_tracker.process_array(to_landmark_array(landmarks), 640, 480)
+            assert result.rep_count == expected.rep_count
+            assert result.stage == expected.stage
+            assert result.feedback == expected.feedback
+        
+        assert result.rep_count == 1
+    
+    def test_float16_array(self):
+        """Test that compact fp16 landmark arrays track the same reps."""
+        tracker = BicepCurlTracker()
+        
+        for landmarks in [self.DOWN] * 3 + [self.UP] * 5 + [self.DOWN] * 5:
+            arr = to_landmark_array(landmarks).astype(np.float16)
+            result = tracker.process_array(arr, 640, 480)
+        
+        assert result.is_valid_pose
+        assert result.rep_count == 1
+    
+    def test_float16_visibility_threshold(self):
+        """Test that the 0.5 threshold is exact in fp16."""
+        tracker = BicepCurlTracker()
+        landmarks = {name: (0.3, 0.3, 0, 0.5) for name in self.DOWN}
+        arr = to_landmark_array(landmarks).astype(np.float16)
+        
+        assert tracker.check_landmarks_visibility(arr) == (True, [])
+    
+    def test_undeclared_landmark_fails_clearly(self):
+        """Test that reading a landmark missing from get_required_landmarks names the tracker."""
+        class UndeclaredTracker(BicepCurlTracker):
+            def process(self, landmarks, frame_width, frame_height):
+                return landmarks["left_knee"]
+        
+        tracker = UndeclaredTracker()
+        with pytest.raises(KeyError, match="left_knee.*UndeclaredTracker.get_required_landmarks"):
+            tracker.process_array(to_landmark_array(self.DOWN), 640, 480)
+    
+    def test_required_landmark_indices(self):
+        """Test that the public indices follow get_required_landmarks order."""
+        tracker = SquatTracker()
+        assert tracker.required_landmark_indices.tolist() == [
+            LANDMARK_INDICES[name] for name in tracker.get_required_landmarks()
+        ]
+    
+    def test_process_array_checks_visibility_once(self):
+        """Test that process() reuses the array visibility check from process_array."""
+        class CapturingTracker(BicepCurlTracker):
+            def process(self, landmarks, frame_width, frame_height):
+                self.seen = landmarks
+                return super().process(landmarks, frame_width, frame_height)
+        
+        tracker = CapturingTracker()
+        landmarks = dict(self.DOWN, left_wrist=(0.3, 0.7, 0, 0.2))
+        result = tracker.process_array(to_landmark_array(landmarks), 640, 480)
+        assert not result.is_valid_pose
+        assert result.feedback == "Can't see: left_wrist"
+        
+        # The recorded result is returned without reading the dict rows
+        tracker.process_array(to_landmark_array(self.DOWN), 640, 480)
+        tracker.seen["left_wrist"] = (0.3, 0.7, 0, 0.2)
+        assert tracker.check_landmarks_visibility(tracker.seen) == (True, [])
+        assert tracker.check_landmarks_visibility(tracker.seen, threshold=0.95)[0] is False
+    
+    def test_missing_landmarks_array(self):
+        """Test that invisible rows give an invalid pose."""
+        tracker = SquatTracker()
+        result = tracker.process_array(to_landmark_array({}), 640, 480)
+        assert not result.is_valid_pose
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
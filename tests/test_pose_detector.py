@@ -6,13 +6,15 @@ Tests for the PoseDetector class and helper functions.
 
 import pytest
 import numpy as np
+import cv2
 import sys
+from types import SimpleNamespace
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.pose_detector import PoseDetector
+from src.pose_detector import PoseDetector, WebcamCapture
 
 
 class TestAngleCalculation:
@@ -153,6 +155,181 @@ class TestPoseDetectorInit:
         detector = PoseDetector()
         assert not detector.is_pose_detected()
         detector.release()
+    
+    def test_landmarks_array_none_initially(self):
+        """Test that no landmark array is available before processing."""
+        detector = PoseDetector()
+        assert detector.get_landmarks_array() is None
+        detector.release()
+    
+    def test_step_no_pose(self):
+        """Test that step returns None for a frame without a person."""
+        detector = PoseDetector()
+        blank = np.zeros((240, 320, 3), dtype=np.uint8)
+        assert detector.step(blank) is None
+        assert detector.is_pose_detected() is False
+        detector.release()
+    
+    def test_inference_downscale(self):
+        """Test that detection runs on a downscaled copy of wide frames."""
+        detector = PoseDetector(inference_width=320)
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        
+        assert detector.process_frame(frame) is frame
+        assert detector._rgb_buf.shape == (240, 320, 3)
+        
+        # Frames at or below the inference width are used as-is
+        narrow = frame[:, :320]
+        assert detector._inference_frame(narrow) is narrow
+        detector.release()
+    
+    def test_fps_window(self, monkeypatch):
+        """Test that FPS is averaged over the frame window."""
+        detector = PoseDetector()
+        ticks = iter(range(0, 10**9, 25_000_000))
+        monkeypatch.setattr("src.pose_detector.time.perf_counter_ns", lambda: next(ticks))
+        
+        detector._update_fps()
+        assert detector.fps == 0
+        for _ in range(PoseDetector.FPS_WINDOW + 5):
+            detector._update_fps()
+        
+        assert detector.fps == pytest.approx(40.0)
+        assert len(detector._frame_times) == PoseDetector.FPS_WINDOW
+        detector.release()
+    
+    def test_draw_fps_label(self):
+        """Test that the FPS label follows the whole-number FPS."""
+        detector = PoseDetector()
+        frame = np.zeros((60, 200, 3), dtype=np.uint8)
+        
+        detector.draw_fps(frame)
+        assert detector._fps_label == (0, "FPS: 0")
+        
+        detector.fps = 29.7
+        detector.draw_fps(frame)
+        assert detector._fps_label == (29, "FPS: 29")
+        assert frame.any()
+        detector.release()
+    
+    def test_draw_landmark_subset(self):
+        """Test that only the requested landmarks are drawn."""
+        detector = PoseDetector()
+        detector.landmarks = [
+            SimpleNamespace(x=0.1 + 0.02 * i, y=0.5, z=0.0, visibility=1.0)
+            for i in range(33)
+        ]
+        frame = np.zeros((100, 1000, 3), dtype=np.uint8)
+        detector.draw_landmarks(frame, subset=[11, 13])
+        
+        assert frame[50, int(0.32 * 1000)].any()
+        assert frame[50, int(0.36 * 1000)].any()
+        assert not frame[50, int(0.40 * 1000)].any()
+        detector.release()
+    
+    def test_draw_landmark_subset_matches_mediapipe(self):
+        """Test that drawing every landmark as a subset matches MediaPipe's drawing."""
+        from mediapipe.framework.formats import landmark_pb2
+        
+        rng = np.random.default_rng(0)
+        landmark_list = landmark_pb2.NormalizedLandmarkList()
+        for _ in range(33):
+            lm = landmark_list.landmark.add()
+            lm.x, lm.y = rng.uniform(-0.1, 1.1, 2)
+            lm.visibility = rng.uniform(0.3, 1.0)
+        
+        detector = PoseDetector()
+        detector.results = SimpleNamespace(pose_landmarks=landmark_list)
+        detector.landmarks = landmark_list.landmark
+        expected = detector.draw_landmarks(np.zeros((240, 320, 3), dtype=np.uint8))
+        frame = detector.draw_landmarks(np.zeros((240, 320, 3), dtype=np.uint8), subset=range(33))
+        
+        assert np.array_equal(frame, expected)
+        detector.release()
+    
+    def test_drawing_specs_reused(self):
+        """Test that drawing specs are rebuilt only when the style changes."""
+        from mediapipe.framework.formats import landmark_pb2
+        
+        landmark_list = landmark_pb2.NormalizedLandmarkList()
+        for _ in range(33):
+            landmark_list.landmark.add(x=0.5, y=0.5, visibility=1.0)
+        
+        detector = PoseDetector()
+        detector.results = SimpleNamespace(pose_landmarks=landmark_list)
+        frame = np.zeros((10, 10, 3), dtype=np.uint8)
+        
+        detector.draw_landmarks(frame)
+        specs = detector._spec_cache[1]
+        detector.draw_landmarks(frame)
+        assert detector._spec_cache[1] is specs
+        
+        detector.draw_landmarks(frame, landmark_color=(0, 0, 255))
+        assert detector._spec_cache[1] is not specs
+        detector.release()
+    
+    def test_get_all_landmarks(self):
+        """Test that all landmarks are keyed by name and scaled to pixels."""
+        detector = PoseDetector()
+        detector.landmarks = [
+            SimpleNamespace(x=0.01 * i, y=0.5, z=0.1, visibility=0.9)
+            for i in range(33)
+        ]
+        
+        landmarks = detector.get_all_landmarks()
+        assert len(landmarks) == 33
+        assert landmarks["left_shoulder"] == (0.11, 0.5, 0.1, 0.9)
+        
+        landmarks = detector.get_all_landmarks(200, 100)
+        assert landmarks["left_shoulder"] == pytest.approx((22.0, 50.0, 0.1, 0.9))
+        detector.release()
+    
+    def test_get_landmark_by_name(self):
+        """Test landmark lookup is case-insensitive and rejects unknown names."""
+        detector = PoseDetector()
+        detector.landmarks = [
+            SimpleNamespace(x=0.01 * i, y=0.5, z=0.1, visibility=0.9)
+            for i in range(33)
+        ]
+        
+        assert detector.get_landmark("left_elbow") == (0.13, 0.5, 0.1, 0.9)
+        assert detector.get_landmark("LEFT_ELBOW") == (0.13, 0.5, 0.1, 0.9)
+        with pytest.raises(ValueError):
+            detector.get_landmark("left_tail")
+        detector.release()
+
+
+class TestWebcamCapture:
+    """Tests for frame capture helpers using a recorded clip."""
+    
+    @pytest.fixture
+    def clip(self, tmp_path):
+        """Write a short clip whose frame i has brightness 50 * i."""
+        path = str(tmp_path / "clip.avi")
+        writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 10, (64, 48))
+        for i in range(5):
+            writer.write(np.full((48, 64, 3), 50 * i, dtype=np.uint8))
+        writer.release()
+        return path
+    
+    def test_read_skip(self, clip):
+        """Test that skipped frames are dropped before the returned frame."""
+        capture = WebcamCapture(clip, 64, 48)
+        assert capture.start()
+        
+        success, frame = capture.read()
+        assert success and frame.mean() < 25
+        success, frame = capture.read(skip=2)
+        assert success and abs(frame.mean() - 150) < 25
+        capture.release()
+    
+    def test_read_skip_past_end(self, clip):
+        """Test that skipping past the end of the stream fails cleanly."""
+        capture = WebcamCapture(clip, 64, 48)
+        assert capture.start()
+        
+        assert capture.read(skip=10) == (False, None)
+        capture.release()
 
 
 if __name__ == "__main__":